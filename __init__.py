@@ -55,6 +55,16 @@ def getLoggerAndFileHandler():
 
 
 class GdalPushLogHandler:
+    # Performance related options, set thread-locally while the handler is pushed.
+    # Directories of aerials may contain thousands of files, possibly on a network drive.
+    # Still let GDAL probe for side-car files like overviews. Hence, TRUE instead of EMPTY_DIR.
+    # HTTP options apply to WMS/WMTS. 2TLS: use HTTP/2 for https only, as plain http servers may fail on upgrading.
+    __configOptions = (('GDAL_DISABLE_READDIR_ON_OPEN', 'TRUE'),
+                       ('VSI_CACHE', 'TRUE'),
+                       ('VSI_CACHE_SIZE', str(256 * 1024 ** 2)),
+                       ('GDAL_HTTP_MULTIPLEX', 'YES'),
+                       ('GDAL_HTTP_VERSION', '2TLS'))
+
     def __enter__(self):
         from osgeo import gdal
 
@@ -64,6 +74,9 @@ class GdalPushLogHandler:
 
         gdal.PushErrorHandler(gdal._pylog_handler)
 
+        for key, value in __class__.__configOptions:
+            gdal.SetThreadLocalConfigOption(key, value)
+
         # Useful: inspect actual HTTP traffic.
         # gdal.SetThreadLocalConfigOption('CPL_DEBUG', 'ON')
 
@@ -85,6 +98,8 @@ class GdalPushLogHandler:
         gdal.SetThreadLocalConfigOption('CPL_CURL_VERBOSE', None)
         gdal.SetThreadLocalConfigOption('GDAL_HTTP_LOW_SPEED_LIMIT', None)
         gdal.SetThreadLocalConfigOption('GDAL_HTTP_LOW_SPEED_TIME', None)
+        for key, _ in __class__.__configOptions:
+            gdal.SetThreadLocalConfigOption(key, None)
 
         return type is None
 
@@ -45,24 +45,31 @@ However, this sounds slow.
 """
 from __future__ import annotations
 
-from qgis.PyQt.QtCore import pyqtSlot, QEvent, QObject, QPointF, QSize, QRect, Qt
-from qgis.PyQt.QtGui import QBitmap, QBrush, QColor, QCursor, QFocusEvent, QHelpEvent, QIcon, QImage, QKeyEvent, QPen, QPainter, QPixmap, QTransform
-from qgis.PyQt.QtWidgets import (QDialog, QGraphicsEffect, QGraphicsEllipseItem, QGraphicsItem, QGraphicsLineItem, QGraphicsPixmapItem,
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot, QEvent, QObject, QPointF, QSize, QSizeF, QRect, Qt, QTimer
+from qgis.PyQt.QtGui import QBitmap, QBrush, QColor, QCursor, QFocusEvent, QHelpEvent, QIcon, QImage, QKeyEvent, QPainterPath, QPen, QPainter, QPixmap, QPixmapCache, QTransform
+from qgis.PyQt.QtWidgets import (QDialog, QGraphicsEffect, QGraphicsEllipseItem, QGraphicsItem, QGraphicsPathItem, QGraphicsPixmapItem,
                                  QGraphicsSceneContextMenuEvent, QGraphicsSceneMouseEvent,
                                  QGraphicsSceneWheelEvent, QMenu, QMessageBox, QStyle, QStyleOptionGraphicsItem, QWhatsThis, QWidget)
 
 import numpy as np
+import pandas as pd
 from osgeo import gdal
 
+import collections
 from concurrent import futures
 import datetime
 import enum
+import itertools
 import json
 import logging
+import math
+import os
 from pathlib import Path
 import sqlite3
+import struct
 import threading
-from typing import cast, Final
+from typing import cast, Final, Iterable
 import weakref
 
 from . import GdalPushLogHandler
@@ -79,9 +86,11 @@ class Availability(enum.IntEnum):
         obj = int.__new__(cls, value)
         obj._value_ = value
         obj.color = color
+        obj.brush = QBrush(color)
         return obj
 
     color: Qt.GlobalColor | QColor
+    brush: QBrush
 
     missing = Qt.gray
     findPreview = QColor(126, 177, 229)  # Qt.blue
@@ -117,34 +126,144 @@ class Visualization(enum.Enum):
 
 
 class InversionEffect(QGraphicsEffect):
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # While highlighted, the effect gets toggled (and hence drawn) repeatedly, mostly for an unchanged source.
+        self.__inverted: QPixmap | None = None
+        self.__sourceCacheKey: int | None = None
+
     def draw(self, painter):
         pixmap, offset = self.sourcePixmap(Qt.DeviceCoordinates)
-        img = pixmap.toImage()
-        img.invertPixels()
+        if self.__inverted is None or pixmap.cacheKey() != self.__sourceCacheKey:
+            img = pixmap.toImage()
+            img.invertPixels()
+            self.__inverted = QPixmap.fromImage(img)
+            self.__sourceCacheKey = pixmap.cacheKey()
         painter.setWorldTransform(QTransform())
-        painter.drawPixmap(offset, QPixmap.fromImage(img))
+        painter.drawPixmap(offset, self.__inverted)
+
+
+# All rows of DB table aerials, loaded at once and stored column by column, instead of being queried aerial by aerial.
+# Changes are buffered, and written back in batches, such that bursts of changes result in a single transaction.
+class AerialsTable:
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db: Final = db
+        rows = db.execute(
+            'SELECT id, usage, scenePos, trafo, trafoLocked, path, previewRect, rasterXSize, rasterYSize FROM aerials ORDER BY id').fetchall()
+        columns = list(zip(*rows)) or [()] * 9
+        self.ids: Final = np.array(columns[0], dtype=str)
+        self.usage: Final = np.array(columns[1], dtype=np.int8)
+        self.scenePos: Final[list[bytes | str]] = list(columns[2])
+        self.trafo: Final[list[bytes | str]] = list(columns[3])
+        self.trafoLocked: Final = np.array(columns[4], dtype=bool)
+        self.path: Final[list[str | None]] = list(columns[5])
+        self.previewRect: Final[list[bytes | str | None]] = list(columns[6])
+        self.rasterXSize: Final[list[int | None]] = list(columns[7])
+        self.rasterYSize: Final[list[int | None]] = list(columns[8])
+        self.id2idx: Final = {imgId: idx for idx, imgId in enumerate(columns[0])}
+        # Not stored in the DB, but derived by AerialImage. Kept here for vectorized filtering.
+        self.availability: Final = np.full(len(rows), Availability.missing, dtype=np.int8)
+        self.__dirty: Final[dict[int, set[str]]] = {}  # row index -> column names
+        self.__flushTimer: Final = QTimer()
+        self.__flushTimer.setSingleShot(True)
+        self.__flushTimer.setInterval(200)
+        self.__flushTimer.timeout.connect(self.flush)
+
+    def setUsage(self, idx: int, usage: Usage) -> None:
+        if self.usage[idx] != usage:
+            self.usage[idx] = usage
+            self.__stage(idx, 'usage')
+
+    def setTrafoLocked(self, idx: int, trafoLocked: bool) -> None:
+        if self.trafoLocked[idx] != trafoLocked:
+            self.trafoLocked[idx] = trafoLocked
+            self.__stage(idx, 'trafoLocked')
+
+    def setScenePosAndTrafo(self, idx: int, scenePos: bytes, trafo: bytes) -> None:
+        if self.scenePos[idx] == scenePos and self.trafo[idx] == trafo:
+            return
+        self.scenePos[idx] = scenePos
+        self.trafo[idx] = trafo
+        self.__stage(idx, 'scenePos', 'trafo')
+
+    def setPathAndPreviewRect(self, idx: int, path: str | None, previewRect: bytes | None) -> None:
+        self.path[idx] = path
+        self.previewRect[idx] = previewRect
+        self.__stage(idx, 'path', 'previewRect')
+
+    def setRasterSize(self, idx: int, width: int, height: int) -> None:
+        self.rasterXSize[idx] = width
+        self.rasterYSize[idx] = height
+        self.__stage(idx, 'rasterXSize', 'rasterYSize')
+
+    def flush(self) -> None:
+        self.__flushTimer.stop()
+        if not self.__dirty:
+            return
+        dirty, self.__dirty = self.__dirty, {}
+        idxsByColumns = collections.defaultdict(list)
+        for idx, columns in dirty.items():
+            idxsByColumns[tuple(sorted(columns))].append(idx)
+        # In autocommit mode, each row updated by executemany would be committed separately.
+        ownTransaction = not self.db.in_transaction
+        try:
+            if ownTransaction:
+                self.db.execute('BEGIN IMMEDIATE TRANSACTION')
+            for columns, idxs in idxsByColumns.items():
+                values = [getattr(self, column) for column in columns]
+                self.db.executemany(
+                    'UPDATE aerials SET {} WHERE id == ?'.format(', '.join(f'{column} = ?' for column in columns)),
+                    ([_toDb(value[idx]) for value in values] + [str(self.ids[idx])] for idx in idxs))
+            if ownTransaction:
+                self.db.execute('COMMIT TRANSACTION')
+        except Exception:
+            # Keep the rows staged for the next attempt.
+            for idx, columns in dirty.items():
+                self.__stage(idx, *columns)
+            if not ownTransaction:
+                raise  # The caller rolls back its transaction.
+            if self.db.in_transaction:
+                self.db.execute('ROLLBACK TRANSACTION')
+            logger.exception('Failed to store the changed aerials.')
+
+    def __stage(self, idx: int, *columns: str) -> None:
+        self.__dirty.setdefault(idx, set()).update(columns)
+        if not self.__flushTimer.isActive():
+            self.__flushTimer.start()
+
+
+def _toDb(value):
+    # sqlite3 does not accept NumPy scalars.
+    return value.item() if isinstance(value, np.generic) else value
 
 
 class AerialObject(QObject):
 
+    # Emitted from a worker thread, such that AerialImage gets the probed size in the GUI thread.
+    rasterSizeProbed = pyqtSignal(int, int)
+
+    # Likewise, emitted if the size could not be determined.
+    rasterSizeProbeFailed = pyqtSignal()
+
     __timerId: int | None = None
 
-    def __init__(self, scene: map_scene.MapScene, posScene: QPointF, imgId: str, meta, db: sqlite3.Connection):
+    def __init__(self, scene: map_scene.MapScene, posScene: QPointF, table: AerialsTable, idx: int, meta, isNew: bool):
         super().__init__()
         point = AerialPoint()
-        image = AerialImage(imgId, posScene, meta, point, db, self)
-        self.__point: Final = weakref.ref(point)
-        self.image: Final = weakref.ref(image)
+        image = AerialImage(table, idx, posScene, meta, point, self, isNew)
+        # The scene owns the items, and they do not outlive self, except during MapScene's clean up.
+        self.__point: Final = point
+        self.image: Final = image
         point.setImage(image)
         image.setVisible(False)
         scene.contrastEnhancementChanged.connect(image.setContrastEnhancement)
-        scene.visualizationChanged.connect(self.__setVisualization)
         scene.highlightAerials.connect(self.__highlight)
         scene.showAsImage.connect(self.__showAsImage)
-        toolTip = [f'<tr><td>{name}</td><td>{value}</td></tr>' for name, value in meta._asdict().items()]
-        toolTip = ''.join(['<table>'] + toolTip + ['</table>'])
+        # Most tooltips are never shown. Hence, let MapScene create them on demand only.
+        self.__meta = meta
+        self.__hasToolTip = False
         for el in point, image:
-            el.setToolTip(toolTip)
             effect = InversionEffect()
             effect.setEnabled(False)
             el.setGraphicsEffect(effect)
@@ -152,8 +271,8 @@ class AerialObject(QObject):
             scene.addItem(el)
 
     def timerEvent(self, event) -> None:
-        for item in (self.image(), self.__point()):
-            if item:
+        for item in (self.image, self.__point):
+            if not sip.isdeleted(item):
                 if effect := item.graphicsEffect():
                     effect.setEnabled(not effect.isEnabled())
 
@@ -162,24 +281,29 @@ class AerialObject(QObject):
     def isAnimated(self) -> bool:
         return self.__timerId is not None
 
-    @pyqtSlot(dict, dict, set)
-    def __setVisualization(self, usages: dict[Usage, bool], visualizations: dict[Availability, Visualization], filteredImageIds: set[str]):
-        if image := self.image():
-            usageIsOn = usages.get(image.usage())
-            visualization = visualizations.get(image.availability())
-            if usageIsOn is None or visualization is None:
-                return
-            isFiltered = not filteredImageIds or image.id() in filteredImageIds
-            image.setVisible(visualization == Visualization.asImage and usageIsOn and isFiltered)
-            if point := self.__point():
-                point.setVisible(visualization == Visualization.asPoint and usageIsOn and isFiltered)
+    def ensureToolTip(self) -> None:
+        if self.__hasToolTip:
+            return
+        meta = self.__meta
+        toolTip = ''.join(itertools.chain(
+            ('<table>',),
+            (prefix + str(value) + '</td></tr>' for prefix, value in zip(_toolTipRowPrefixes(meta), meta)),
+            ('</table>',)))
+        for el in self.__point, self.image:
+            el.setToolTip(toolTip)
+        self.__hasToolTip = True
+
+    def setVisualization(self, asImage: bool, asPoint: bool) -> None:
+        # Called by MapScene, which evaluates visualizationChanged for all aerials at once.
+        _setVisible(self.image, asImage)
+        _setVisible(self.__point, asPoint)
 
     @pyqtSlot(set)
     def __highlight(self, imgIds) -> None:
-        image = self.image()
-        if image and image.id() in imgIds:
-            for item in (image, self.__point()):
-                if item and item.isVisible():
+        image = self.image
+        if image.id() in imgIds:
+            for item in (image, self.__point):
+                if item.isVisible() and not item.hasFocus():
                     item.setFocus()
             # animate
             if self.__timerId is None:
@@ -190,27 +314,25 @@ class AerialObject(QObject):
             if self.__timerId is not None:
                 self.killTimer(self.__timerId)
                 self.__timerId = None
-                for item in (image, self.__point()):
-                    if item:
-                        if effect := item.graphicsEffect():
-                            effect.setEnabled(False)
+                for item in (image, self.__point):
+                    if effect := item.graphicsEffect():
+                        effect.setEnabled(False)
                 self.__updateZValues()
 
     @pyqtSlot(str, bool)
     def __showAsImage(self, imgId, show) -> None:
-        image = self.image()
-        point = self.__point()
-        if image and image.id() == imgId and point:
-            image.setVisible(show)
-            point.setVisible(not show)
+        image = self.image
+        point = self.__point
+        if image.id() == imgId:
+            _setVisible(image, show)
+            _setVisible(point, not show)
             focusItem = image if show else point
-            focusItem.setFocus(Qt.OtherFocusReason)
+            if not focusItem.hasFocus():
+                focusItem.setFocus(Qt.OtherFocusReason)
 
     def __updateZValues(self) -> None:
-        if image := self.image():
-            updateZValue(image)
-        if point := self.__point():
-            updateZValue(point)
+        updateZValue(self.image)
+        updateZValue(self.__point)
 
 
 class AerialPoint(QGraphicsEllipseItem):
@@ -223,14 +345,20 @@ class AerialPoint(QGraphicsEllipseItem):
         self.setCursor(Qt.PointingHandCursor)
         self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
         self.__transformState = TransformState.original
-        self.__cross: Final = _makeOverlay('cross', self)
-        self.__tick: Final = _makeOverlay('tick', self)
+        self.__overlays: Final[dict[str, QGraphicsPixmapItem]] = {}
         self.__image: weakref.ref | None = None
+        # The pens and brushes in use are shared. Hence, identity tells if they are unchanged.
+        self.__penInUse: QPen | None = None
+        self.__brushInUse: QBrush | None = None
 
     def itemChange(self, change: QGraphicsItem.GraphicsItemChange, v):
         if change == QGraphicsItem.ItemVisibleHasChanged:
             if scene := cast(map_scene.MapScene, self.scene()):
                 scene.addAerialsVisible.emit(1 if v else -1)
+                scene.setAerialVisible(self, v)
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            if v is not None and self.isVisible():
+                v.setAerialVisible(self, True)
         return super().itemChange(change, v)
 
     def mouseDoubleClickEvent(self, event: QGraphicsSceneMouseEvent) -> None:
@@ -273,32 +401,55 @@ class AerialPoint(QGraphicsEllipseItem):
             return self.__image()
 
     def setAvailability(self, availability: Availability) -> None:
-        self.setBrush(QBrush(availability.color))
+        if availability.brush is not self.__brushInUse:
+            self.__brushInUse = availability.brush
+            self.setBrush(availability.brush)
 
     def setUsage(self, usage: Usage) -> None:
-        self.__cross.setVisible(usage == Usage.discarded)
-        self.__tick.setVisible(usage == Usage.selected)
+        _setOverlayVisible(self.__overlays, 'cross', self, usage == Usage.discarded)
+        _setOverlayVisible(self.__overlays, 'tick', self, usage == Usage.selected)
 
     def setTransformState(self, transformState: TransformState) -> None:
         self.__transformState = transformState
         self.__setPen()
 
     def __setPen(self) -> None:
-        self.setPen(QPen(QColor(162, 17, 17) if self.__transformState == TransformState.locked else Qt.black,
-                         3 if self.hasFocus() else 2,
-                         self.__transformState.penStyle))
+        pen = _pointPen(self.__transformState, self.hasFocus())
+        if pen is not self.__penInUse:
+            self.__penInUse = pen
+            self.setPen(pen)
 
 
 class AerialImage(QGraphicsPixmapItem):
 
     __pixMapWidth: Final = 3000  # Approx. width of a microfilm scan, it seems.
 
+    # Pixmaps are read with a resolution that suits their size on screen, but always displayed with a width of __pixMapWidth.
+    __minPixMapResolution: Final = 256
+
+    # Below this width on screen, pixmaps are painted without smoothing.
+    __smoothPaintMinWidth: Final = 64
+
     __rotateCursor: Final = QCursor(QPixmap(':/plugins/selorecon/rotate'))
 
     __transparencyCursor: Final = QCursor(QPixmap(':/plugins/selorecon/eye'))
 
     __threadPool: futures.ThreadPoolExecutor | None = None
 
+    # Qt reports position and transform changes at a high rate while aerials are dragged, zoomed, or rotated.
+    # Hence, collect them and only emit the latest footprint of each aerial.
+    __pendingFootprints: Final[dict[str, weakref.ref]] = {}
+
+    __footprintTimer: QTimer | None = None
+
+    # Placeholders are never painted onto. Hence, aerials of the same size can share one, thanks to Qt's implicit sharing.
+    __placeholders: Final[dict[tuple[int, int], QBitmap]] = {}
+
+    __maxPlaceholders: Final = 32
+
+    # Whether the film directories below previewRootDir exist. Many aerials share the same film.
+    __filmDirExists: Final[dict[str, bool]] = {}
+
     # To be set beforehand by the scene:
 
     imageRootDir: Path
@@ -307,6 +458,15 @@ class AerialImage(QGraphicsPixmapItem):
 
     scaleCartesian2map: float
 
+    @staticmethod
+    def probeFilmDirs(filmDirs: Iterable[str]) -> None:
+        # Check the existence of all film directories at once and concurrently, instead of one by one during construction.
+        # previewRootDir may be on a network drive, and os.stat releases the GIL.
+        __class__.__filmDirExists.clear()
+        filmDirs = set(filmDirs)
+        __class__.__filmDirExists.update(zip(
+            filmDirs, __class__.__pool().map(lambda filmDir: (__class__.previewRootDir / filmDir).exists(), filmDirs)))
+
     @staticmethod
     def createTables(db: sqlite3.Connection) -> None:
         db.execute('''
@@ -323,21 +483,55 @@ class AerialImage(QGraphicsPixmapItem):
             (
                 id TEXT PRIMARY KEY NOT NULL,  -- <sortie>/<bildnr>.ecw
                 usage INT NOT NULL REFERENCES usages(id),
-                scenePos TEXT NOT NULL,
-                trafo TEXT NOT NULL,
+                scenePos BLOB NOT NULL,        -- 2 little-endian doubles. Legacy databases store JSON text.
+                trafo BLOB NOT NULL,           -- 9 little-endian doubles. Legacy databases store JSON text.
                 trafoLocked INT NOT NULL DEFAULT 0,
                 path TEXT,                     -- Relative to imageRootDir if previewRect is NULL else to previewRootDir.
-                previewRect TEXT CHECK(previewRect ISNULL OR path NOTNULL),
-                meta TEXT NOT NULL
+                previewRect BLOB CHECK(previewRect ISNULL OR path NOTNULL),  -- 5 little-endian ints. Legacy databases store JSON text.
+                meta TEXT NOT NULL,
+                rasterXSize INTEGER,           -- Of imageRootDir / path, once probed.
+                rasterYSize INTEGER
             ) ''')
+        # Migrate databases created before the raster size got stored.
+        columns = {row[1] for row in db.execute('PRAGMA table_info(aerials)')}
+        for column in ('rasterXSize', 'rasterYSize'):
+            if column not in columns:
+                db.execute(f'ALTER TABLE aerials ADD COLUMN {column} INTEGER')
+
+    @staticmethod
+    def insertAerials(db: sqlite3.Connection, aerials: Iterable[tuple]) -> None:
+        # Insert the rows of all new aerials at once, before creating them. aerials: (imgId, posScene, path, meta)
+        # Store their original position and transform already, so their construction does not need to update the rows.
+        db.executemany(
+            'INSERT INTO aerials (id, usage, scenePos, trafo, path, meta) VALUES(?, ?, ?, ?, ?, ?)',
+            ((imgId, Usage.unset, _packPos(pos), _packTransform(__class__.__origTransformFor(meta.Radius_Bild)), path, _metaToJson(meta))
+             for imgId, pos, path, meta in aerials))
+
+    @staticmethod
+    def __origTransformFor(radiusBild: float) -> QTransform:
+        scale = radiusBild * __class__.scaleCartesian2map / (__class__.__pixMapWidth / 2)
+        # Actually, 2 times this scale seems a bit closer to the true scale.
+        return QTransform.fromScale(scale, scale)
+
+    @staticmethod
+    def __emitFootprints() -> None:
+        images = list(__class__.__pendingFootprints.values())
+        __class__.__pendingFootprints.clear()
+        for image in images:
+            # The scene may have been cleared meanwhile.
+            if (image := image()) is not None and not sip.isdeleted(image):
+                if scene := image.scene():
+                    scene.aerialFootPrintChanged.emit(image.id(), image.footprint())
 
     @staticmethod
     def unload():
         if __class__.__threadPool is not None:
             __class__.__threadPool.shutdown(wait=False, cancel_futures=True)
 
-    def __init__(self, imgId: str, pos: QPointF, meta, point: AerialPoint, db: sqlite3.Connection, obj: AerialObject):
+    def __init__(self, table: AerialsTable, idx: int, pos: QPointF, meta, point: AerialPoint, obj: AerialObject, isNew: bool):
         super().__init__()
+        # While applying the position and transform stored in the table, do not store them back, nor change the transform state.
+        self.__isRestoring = False
         self.setFlag(QGraphicsItem.ItemIsMovable)
         self.setFlag(QGraphicsItem.ItemIsFocusable)
         self.setFlag(QGraphicsItem.ItemSendsGeometryChanges)
@@ -345,50 +539,53 @@ class AerialImage(QGraphicsPixmapItem):
         self.setTransformationMode(Qt.SmoothTransformation)
         self.__origPos: Final = pos
         self.__radiusBild: Final[float] = meta.Radius_Bild
+        self.__invRadiusBild: Final = 1 / self.__radiusBild
+        self.__origTransform: Final = __class__.__origTransformFor(self.__radiusBild)
         self.__point: Final = point
         self.__opacity: float = 1.
-        self.__requestedPixMapParams: tuple[str, QRect, int, ContrastEnhancement] | None  = None
+        self.__requestedPixMapParams: tuple[str, QRect, int, ContrastEnhancement, int] | None  = None
         self.__currentContrast: ContrastEnhancement = ContrastEnhancement.clahe if claheAvailable else ContrastEnhancement.histogram
-        self.__futurePixmap: futures.Future | None = None
-        self.__futurePixmapLock: Final = threading.Lock()
-        self.__lastRequestedFuture: futures.Future | None = None
-        self.__lastRequestedFutureLock: Final = threading.Lock()
-        self.__db: Final = db
+        # Only the latest request gets computed. Requests that are superseded before their computation has started get dropped.
+        self.__pendingPixMapParams: tuple[str, tuple[Path, int, int, QRect, int, ContrastEnhancement]] | None = None
+        self.__pixMapWorkerBusy = False
+        self.__readyPixMap: tuple[str, QImage] | Exception | None = None
+        self.__pixMapLock: Final = threading.Lock()
+        self.__table: Final = table
+        self.__idx: Final = idx
         self.object: Final = obj
-        self.__id: Final = imgId
+        self.__id: Final[str] = str(table.ids[idx])
         self.__availability: Availability | None = None
         self.__transformState: TransformState = TransformState.original
-        self.__lock: Final = _makeOverlay('lock', self, QGraphicsItem.ItemIgnoresTransformations)
-        self.__cross: Final = _makeOverlay('cross', self, QGraphicsItem.ItemIgnoresTransformations)
-        self.__tick: Final = _makeOverlay('tick', self, QGraphicsItem.ItemIgnoresTransformations)
-
-        if row := db.execute('SELECT usage, scenePos, trafo, trafoLocked FROM aerials WHERE id == ?', [imgId]).fetchone():
-            usage = Usage(row[0])
-            self.setPos(QPointF(*json.loads(row[1])))
-            self.setTransform(QTransform(*json.loads(row[2])))
-            if row[3]:
+        self.__usage: Usage = Usage.unset  # Mirrors the DB.
+        self.__footprint: list[dict[str, float]] | None = None
+        self.__overlays: Final[dict[str, QGraphicsPixmapItem]] = {}
+        self.__isProbingRasterSize = False
+        self.__showsPlaceholder = False
+        obj.rasterSizeProbed.connect(self.__setRasterSize)
+        obj.rasterSizeProbeFailed.connect(self.__onRasterSizeProbeFailed)
+
+        # Rows of new aerials have been inserted by insertAerials before table was loaded.
+        usage = Usage(int(table.usage[idx]))
+        if isNew:
+            # The row already stores the original position and transform, so this does not stage an update.
+            self.__resetTransform()
+        else:
+            self.__isRestoring = True
+            try:
+                self.setPos(_unpackPos(table.scenePos[idx]))
+                self.setTransform(_unpackTransform(table.trafo[idx]))
+            finally:
+                self.__isRestoring = False
+            if isinstance(table.scenePos[idx], str) or isinstance(table.trafo[idx], str):
+                # Legacy DBs store JSON.
+                table.setScenePosAndTrafo(idx, _packPos(self.pos()), _packTransform(self.transform()))
+            if table.trafoLocked[idx]:
                 trafoState = TransformState.locked
-            elif self.transform() == self.__originalTransform() and self.pos() == self.__origPos:
+            elif self.transform() == self.__origTransform and self.pos() == self.__origPos:
                 trafoState = TransformState.original
             else:
                 trafoState = TransformState.changed
             self.__setTransformState(trafoState)
-        else:
-            def toJson(value):
-                if isinstance(value, datetime.date):
-                    return str(value)
-                raise TypeError(f'Unable to encode type {value.__class__}')
-
-            db.execute(
-                'INSERT INTO aerials (id, usage, scenePos, trafo, path, meta) VALUES(?, ?, ?, ?, ?, ?)',
-                [imgId,
-                 Usage.unset,
-                 json.dumps([pos.x(), pos.y()]),
-                 json.dumps(np.eye(3).ravel().tolist()),
-                 imgId if (__class__.imageRootDir / imgId).exists() else None,
-                 json.dumps(meta._asdict(), default=toJson)])
-            usage = Usage.unset
-            self.__resetTransform()
         self.__deriveAvailability()
         self.__setUsage(usage)
         self.__setPixMap()
@@ -399,24 +596,19 @@ class AerialImage(QGraphicsPixmapItem):
                 self.__requestPixMap()
             if scene := self.scene():
                 scene.addAerialsVisible.emit(1 if v else -1)
+                scene.setAerialVisible(self, v)
+        elif change == QGraphicsItem.ItemSceneHasChanged:
+            if v is not None and self.isVisible():
+                v.setAerialVisible(self, True)
         elif change == QGraphicsItem.ItemPositionHasChanged:
             self.__point.setPos(v)
-            self.__db.execute(
-                'UPDATE aerials SET scenePos = ? WHERE id == ?',
-                [json.dumps([v.x(), v.y()]), self.__id])
-            if scene := self.scene():
-                scene.aerialFootPrintChanged.emit(self.__id, self.footprint())
-            self.__setTransformState(TransformState.changed)
+            if not self.__isRestoring:
+                self.__storeScenePosAndTrafo()
+                self.__setTransformState(TransformState.changed)
         elif change == QGraphicsItem.ItemTransformHasChanged:
-            self.__db.execute(
-                'UPDATE aerials SET trafo = ? WHERE id == ?',
-                [json.dumps([
-                    v.m11(), v.m12(), v.m13(),
-                    v.m21(), v.m22(), v.m23(),
-                    v.m31(), v.m32(), v.m33()]), self.__id])
-            if scene := self.scene():
-                scene.aerialFootPrintChanged.emit(self.__id, self.footprint())
-            self.__setTransformState(TransformState.changed)
+            if not self.__isRestoring:
+                self.__storeScenePosAndTrafo()
+                self.__setTransformState(TransformState.changed)
         return super().itemChange(change, v)
 
     def mousePressEvent(self, event: QGraphicsSceneMouseEvent) -> None:
@@ -554,7 +746,7 @@ Double-click to close.<br/>
         menu.addSeparator()
         if self.__transformState == TransformState.locked:
             menu.addAction(QIcon(':/plugins/selorecon/unlock'), 'Unlock transform',
-                           lambda: self.__setTransformState(TransformState.original if (self.transform() == self.__originalTransform() and self.pos() == self.__origPos) else TransformState.changed))
+                           lambda: self.__setTransformState(TransformState.original if (self.transform() == self.__origTransform and self.pos() == self.__origPos) else TransformState.changed))
         elif self.flags() & QGraphicsItem.ItemIsMovable:
             if self.__availability in (Availability.image, ):  # TODO Availability.preview
                 menu.addAction(QIcon(':/plugins/selorecon/magnet'), 'Auto-georeference', self.__georeference)
@@ -563,24 +755,45 @@ Double-click to close.<br/>
             menu.addAction(QIcon(':/plugins/selorecon/home'), 'Reset transform', self.__resetTransform)
         menu.exec(event.screenPos())
 
+    def shape(self) -> QPainterPath:
+        # Qt 5 builds the BoundingRectShape from the pixmap's size in device pixels, ignoring its devicePixelRatio.
+        # Hence, for ratios other than 1, hit-testing would miss parts of the image. Use the logical bounding rect instead.
+        path = QPainterPath()
+        path.addRect(self.boundingRect())
+        return path
+
     def paint(self, painter: QPainter, option: QStyleOptionGraphicsItem, widget: QWidget) -> None:
-        pm = None
-        with self.__futurePixmapLock:
-            if self.__futurePixmap is not None:
-                pm = self.__futurePixmap.result()  # result() might raise here, in the wanted thread.
-                self.__futurePixmap = None
+        with self.__pixMapLock:
+            pm, self.__readyPixMap = self.__readyPixMap, None
+        if isinstance(pm, Exception):
+            raise pm  # Raise here, in the wanted thread.
         if pm is not None:
-            self.__setPixMap(pm)
-        super().paint(painter, option, widget)
+            key, img = pm
+            # QPixmap and QPixmapCache must only be used in the GUI thread.
+            pm = QPixmap.fromImage(img)
+            QPixmapCache.insert(key, pm)
+            # A cached pixmap may have been set meanwhile.
+            if key == _pixMapCacheKey(self.__requestedPixMapParams):
+                self.__setPixMap(pm)
+        onScreenWidth = __class__.__pixMapWidth * option.levelOfDetailFromTransform(painter.worldTransform())
+        if self.__requestedPixMapParams is not None:
+            # Zoomed in: request a pixmap with a higher resolution.
+            if self.__pixMapResolutionFor(onScreenWidth) > self.__requestedPixMapParams[-1]:
+                self.__requestPixMap(onScreenWidth)
+        if onScreenWidth < __class__.__smoothPaintMinWidth:
+            # Smoothing is invisible at this size, but expensive. QGraphicsPixmapItem.paint would enable it as set by setTransformationMode.
+            painter.save()
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+            painter.drawPixmap(self.offset(), self.pixmap())
+            painter.restore()
+        else:
+            super().paint(painter, option, widget)
         painter.save()
         # Qt 5.15 docs for QGraphicsItem::paint say:
         #   "QGraphicsItem does not support use of cosmetic pens with a non-zero width."
         # But obviously, it does support them, at least on Windows.
-        width = 2 if option.state & QStyle.State_HasFocus else 1
         assert self.__availability is not None
-        pen = QPen(self.__availability.color, width, self.__transformState.penStyle)
-        pen.setCosmetic(True)
-        painter.setPen(pen)
+        painter.setPen(_imagePen(self.__availability, self.__transformState, bool(option.state & QStyle.State_HasFocus)))
         painter.drawRect(self.boundingRect())
         painter.restore()
 
@@ -589,65 +802,149 @@ Double-click to close.<br/>
 
     # end of overrides
 
+    def __storeScenePosAndTrafo(self) -> None:
+        self.__table.setScenePosAndTrafo(self.__idx, _packPos(self.pos()), _packTransform(self.transform()))
+        self.__scheduleFootprintEmission()
+
+    def __scheduleFootprintEmission(self) -> None:
+        self.__footprint = None
+        if self.scene() is None:
+            return  # Still in __init__. MapScene emits all footprints once loaded.
+        __class__.__pendingFootprints[self.__id] = weakref.ref(self)
+        if __class__.__footprintTimer is None:
+            timer = __class__.__footprintTimer = QTimer()
+            timer.setSingleShot(True)
+            timer.setInterval(50)
+            timer.timeout.connect(__class__.__emitFootprints)
+        if not __class__.__footprintTimer.isActive():
+            __class__.__footprintTimer.start()
+
     def __setPixMap(self, pm: QPixmap | None = None):
         if pm is None:
             pixMapWidth = __class__.__pixMapWidth
-            path, previewRect = self.__db.execute('SELECT path, previewRect FROM aerials WHERE id == ?',
-                                                  [self.__id]).fetchone()
+            path, previewRect = self.__pathAndPreviewRect()
             if previewRect:
-                width, height, rotation = json.loads(previewRect)[2:]
+                width, height, rotation = _unpackPreviewRect(previewRect)[2:]
                 if rotation % 2:
                     width, height = height, width
-            elif path:
-                with GdalPushLogHandler():
-                    ds = gdal.Open(str(__class__.imageRootDir / path))
-                    width, height = ds.RasterXSize, ds.RasterYSize
+            elif path and self.__table.rasterXSize[self.__idx] is not None:
+                width, height = self.__table.rasterXSize[self.__idx], self.__table.rasterYSize[self.__idx]
             else:
+                if path:
+                    # Do not open the dataset in the GUI thread. Use a square until the size is known.
+                    self.__probeRasterSize()
                 width, height = [pixMapWidth] * 2
-            pm = QBitmap(pixMapWidth, _pixMapHeightFor(pixMapWidth, QSize(width, height)))
-            pm.fill(Qt.color1)
+            size = pixMapWidth, _pixMapHeightFor(pixMapWidth, QSize(width, height))
+            pm = __class__.__placeholders.get(size)
+            if pm is None:
+                if len(__class__.__placeholders) >= __class__.__maxPlaceholders:
+                    del __class__.__placeholders[next(iter(__class__.__placeholders))]
+                pm = __class__.__placeholders[size] = QBitmap(*size)
+                pm.fill(Qt.color1)
+            self.__showsPlaceholder = True
+        else:
+            self.__showsPlaceholder = False
         origPm = self.pixmap()
+        if pm.cacheKey() == origPm.cacheKey():
+            return  # E.g. the same placeholder, or a hit in QPixmapCache that is shown already.
+        origSize = _logicalSize(origPm)
+        size = _logicalSize(pm)
         self.setPixmap(pm)
-        self.setOffset(-pm.width() / 2, -pm.height() / 2)
-        if origPm.size() != pm.size():
-            if scene := self.scene():
-                scene.aerialFootPrintChanged.emit(self.__id, self.footprint())
+        self.setOffset(-size.width() / 2, -size.height() / 2)
+        if origSize != size:
+            self.__scheduleFootprintEmission()
+
+    def __probeRasterSize(self) -> None:
+        if self.__isProbingRasterSize:
+            return
+        self.__isProbingRasterSize = True
+        path, _ = self.__pathAndPreviewRect()
+        __class__.__pool().submit(_probeRasterSize, __class__.imageRootDir / path, self.object)
+
+    def __onRasterSizeProbeFailed(self) -> None:
+        # Keep the placeholder, but probe again the next time it is set. The file may be accessible by then.
+        self.__isProbingRasterSize = False
+
+    def __setRasterSize(self, width: int, height: int) -> None:
+        self.__isProbingRasterSize = False
+        if sip.isdeleted(self):
+            return  # The scene has been cleared meanwhile.
+        self.__table.setRasterSize(self.__idx, width, height)
+        if self.__showsPlaceholder:
+            self.__setPixMap()
 
-    def __requestPixMap(self):
-        path, previewRect = self.__db.execute('SELECT path, previewRect FROM aerials WHERE id == ?',
-                                              [self.__id]).fetchone()
+    @staticmethod
+    def __pool() -> futures.ThreadPoolExecutor:
+        if __class__.__threadPool is None:
+            # Each task opens its own GDAL dataset, so reading and decoding scale with the number of cores.
+            __class__.__threadPool = futures.ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix='AerialReader')
+        return __class__.__threadPool
+
+    def __requestPixMap(self, onScreenWidth: float | None = None):
+        path, previewRect = self.__pathAndPreviewRect()
         if previewRect is None:
             rotationCcw = 0
             previewRect = QRect()
         else:
-            *rect, rotationCcw = json.loads(previewRect)
+            *rect, rotationCcw = _unpackPreviewRect(previewRect)
             previewRect = QRect(*rect)
+        if onScreenWidth is None:
+            onScreenWidth = self.__onScreenWidth()
+        resolution = self.__pixMapResolutionFor(onScreenWidth)
+        params = path, previewRect, rotationCcw, self.__currentContrast, resolution
         if self.__availability in (Availability.preview, Availability.image):
-            if not self.__requestedPixMapParams or self.__requestedPixMapParams != (path, previewRect, rotationCcw, self.__currentContrast):
-                if __class__.__threadPool is None:
-                    __class__.__threadPool = futures.ThreadPoolExecutor(thread_name_prefix='AerialReader')
-                absPath = __class__.imageRootDir / path if previewRect.isNull() else __class__.previewRootDir / path
-                future = __class__.__threadPool.submit(_getPixMap, absPath, __class__.__pixMapWidth,
-                                                       previewRect, rotationCcw, self.__currentContrast)
-                future.add_done_callback(self.__pixMapReady)
-                with self.__lastRequestedFutureLock:
-                    if self.__lastRequestedFuture:
-                        self.__lastRequestedFuture.cancel()
-                    self.__lastRequestedFuture = future
-        self.__requestedPixMapParams = path, previewRect, rotationCcw, self.__currentContrast
-
-    def __pixMapReady(self, future: futures.Future) -> None:
-         # This is called from a worker thread.
-        with self.__lastRequestedFutureLock:
-            if self.__lastRequestedFuture is not future:
-                # Another pixmap has been requested after this one.
-                # Still, this one has been received after the other one.
-                # This is possible only if they were computed in different worker threads of the pool,
-                # and it is more probable if the computation of this pixmap has been more elaborate.
-                return
-        with self.__futurePixmapLock:
-            self.__futurePixmap = future
-        self.update()
+            if not self.__requestedPixMapParams or self.__requestedPixMapParams != params:
+                key = _pixMapCacheKey(params)
+                pm = QPixmapCache.find(key)
+                if pm is not None and not pm.isNull():
+                    with self.__pixMapLock:
+                        self.__pendingPixMapParams = None
+                    self.__setPixMap(pm)
+                else:
+                    absPath = __class__.imageRootDir / path if previewRect.isNull() else __class__.previewRootDir / path
+                    with self.__pixMapLock:
+                        self.__pendingPixMapParams = key, (absPath, resolution, __class__.__pixMapWidth,
+                                                           previewRect, rotationCcw, self.__currentContrast)
+                        startWorker = not self.__pixMapWorkerBusy
+                        self.__pixMapWorkerBusy = True
+                    if startWorker:
+                        __class__.__pool().submit(self.__computePixMaps)
+        self.__requestedPixMapParams = params
+
+    def __onScreenWidth(self) -> float:
+        if scene := self.scene():
+            if views := scene.views():
+                return __class__.__pixMapWidth * abs(self.deviceTransform(views[0].viewportTransform()).determinant()) ** .5
+        return __class__.__pixMapWidth
+
+    @staticmethod
+    def __pixMapResolutionFor(onScreenWidth: float) -> int:
+        # Use a few discrete resolutions only, so zooming does not trigger re-reading all the time.
+        resolution = __class__.__minPixMapResolution
+        while resolution < onScreenWidth and resolution < __class__.__pixMapWidth:
+            resolution *= 2
+        return min(resolution, __class__.__pixMapWidth)
+
+    def __computePixMaps(self) -> None:
+        # This is called from a worker thread.
+        # There is at most one such call per aerial at a time, so there is no need to sort out results computed in parallel.
+        while True:
+            with self.__pixMapLock:
+                pending, self.__pendingPixMapParams = self.__pendingPixMapParams, None
+                if pending is None:
+                    self.__pixMapWorkerBusy = False
+                    return
+            key, params = pending
+            try:
+                pm = key, _getImage(*params)
+            except Exception as ex:
+                pm = ex
+            with self.__pixMapLock:
+                if self.__pendingPixMapParams is not None:
+                    # Another pixmap has been requested meanwhile, which makes this one outdated.
+                    continue
+                self.__readyPixMap = pm
+            self.update()
 
     def setContrastEnhancement(self, contrast: ContrastEnhancement):
         self.__currentContrast = contrast
@@ -659,10 +956,13 @@ Double-click to close.<br/>
         return self.__availability
 
     def __deriveAvailability(self) -> None:
-        path, rect = self.__db.execute('SELECT path, previewRect FROM aerials WHERE id == ?', [self.__id]).fetchone()
+        path, rect = self.__pathAndPreviewRect()
         if path is None:
-            filmDir = self.previewRootDir / Path(self.__id).parent
-            availability = Availability.findPreview if filmDir.exists() else Availability.missing
+            filmDir = self.__id.rpartition('/')[0]
+            filmDirExists = __class__.__filmDirExists.get(filmDir)
+            if filmDirExists is None:
+                filmDirExists = __class__.__filmDirExists[filmDir] = (self.previewRootDir / filmDir).exists()
+            availability = Availability.findPreview if filmDirExists else Availability.missing
         else:
             availability = Availability.image if rect is None else Availability.preview
         if self.__availability != availability:
@@ -672,29 +972,29 @@ Double-click to close.<br/>
                     absPath = str(__class__.previewRootDir / path if rect else __class__.imageRootDir / path)
                 scene.aerialAvailabilityChanged.emit(self.__id, int(availability), absPath)
         self.__availability = availability
+        self.__table.availability[self.__idx] = availability
         self.__point.setAvailability(availability)
         self.__setMovability()
 
+    def __pathAndPreviewRect(self) -> tuple[str | None, str | None]:
+        return self.__table.path[self.__idx], self.__table.previewRect[self.__idx]
+
     def __setMovability(self) -> None:
         # __init__: self.__availability is None; __setMovability will be called again right after, via __deriveAvailability.
         availability = self.__availability or Availability.missing
         self.setFlag(QGraphicsItem.ItemIsMovable, availability >= Availability.preview and self.__transformState != TransformState.locked)
 
     def usage(self) -> Usage:
-        value, = self.__db.execute(
-            'SELECT usage FROM aerials WHERE id == ?',
-            [self.__id]).fetchone()
-        return Usage(value)
+        return self.__usage
 
     def __setUsage(self, usage: Usage) -> None:
-        self.__cross.setVisible(usage == Usage.discarded)
-        self.__tick.setVisible(usage == Usage.selected)
+        self.__usage = usage
+        _setOverlayVisible(self.__overlays, 'cross', self, usage == Usage.discarded, QGraphicsItem.ItemIgnoresTransformations)
+        _setOverlayVisible(self.__overlays, 'tick', self, usage == Usage.selected, QGraphicsItem.ItemIgnoresTransformations)
         self.__point.setUsage(usage)
         if scene := self.scene():
             scene.aerialUsageChanged.emit(self.__id, int(usage))
-        self.__db.execute(
-            'UPDATE aerials SET usage = ? WHERE id == ?',
-            [usage, self.__id])
+        self.__table.setUsage(self.__idx, usage)
 
     def transformState(self) -> TransformState:
         return self.__transformState
@@ -702,21 +1002,14 @@ Double-click to close.<br/>
     def __setTransformState(self, transformState: TransformState) -> None:
         self.__transformState = transformState
         isLocked = transformState == TransformState.locked
-        self.__db.execute(
-            'UPDATE aerials SET trafoLocked = ? WHERE id == ?',
-            [isLocked, self.__id])
-        self.__lock.setVisible(isLocked)
+        self.__table.setTrafoLocked(self.__idx, isLocked)
+        _setOverlayVisible(self.__overlays, 'lock', self, isLocked, QGraphicsItem.ItemIgnoresTransformations)
         self.__setMovability()
         updateZValue(self)
         self.__point.setTransformState(transformState)
 
-    def __originalTransform(self) -> QTransform:
-        scale = self.__radiusBild * __class__.scaleCartesian2map / (__class__.__pixMapWidth / 2)
-        # Actually, 2 times this scale seems a bit closer to the true scale.
-        return QTransform.fromScale(scale, scale)
-
     def __resetTransform(self):
-        self.setTransform(self.__originalTransform())
+        self.setTransform(self.__origTransform)
         self.setPos(self.__origPos)
         self.__setTransformState(TransformState.original)
 
@@ -733,11 +1026,13 @@ Double-click to close.<br/>
         dialog = PreviewWindow(filmDir, Path(self.__id).stem)
         if dialog.exec() == QDialog.Accepted:
             path, rect, viewRotationCcw = dialog.selection()
-            self.__db.execute(
-                'UPDATE aerials SET path = ?, previewRect = ? WHERE id == ?',
-                [str(path.relative_to(__class__.previewRootDir)),
-                 json.dumps([rect.left(), rect.top(), rect.width(), rect.height(), viewRotationCcw]),
-                 self.__id])
+            if self.__requestedPixMapParams is not None:
+                # The previous pixmap will most probably not be needed any more.
+                QPixmapCache.remove(_pixMapCacheKey(self.__requestedPixMapParams))
+            self.__table.setPathAndPreviewRect(
+                self.__idx,
+                str(path.relative_to(__class__.previewRootDir)),
+                _previewRectStruct.pack(rect.left(), rect.top(), rect.width(), rect.height(), viewRotationCcw))
             self.__deriveAvailability()
             self.__requestPixMap()
 
@@ -745,87 +1040,166 @@ Double-click to close.<br/>
         # Pass current aerial orientation as GDAL transform
         pos = self.pos()
         tr: QTransform = self.transform()
-        transform = np.array([[tr.m11(), tr.m12(), tr.m13()],
-                              [tr.m21(), tr.m22(), tr.m23()],
-                              [tr.m31(), tr.m32(), tr.m33()]])
-        assert abs(transform[2, :] - (0, 0, 1)).max() < 1.e-7
-        assert abs(transform[:, 2] - (0, 0, 1)).max() < 1.e-7
+        assert max(abs(tr.m13()), abs(tr.m23()), abs(tr.dx()), abs(tr.dy()), abs(tr.m33() - 1.)) < 1.e-7
         # Top/left image corner in scene CS.
-        # Same as: transform[:2, :2].T @ self.offset() + self.pos()
+        # Same as: tr.map(self.offset()) + self.pos()
         topLeft = self.mapToScene(self.offset())
-        gdalTrafo = np.zeros((2, 3))
-        gdalTrafo[:, 0] = topLeft.x(), topLeft.y()
-        gdalTrafo[:, 1:] = transform[:2, :2].T  # Qt actually uses the transpose.
-        path, previewRect = self.__db.execute('SELECT path, previewRect FROM aerials WHERE id == ?',
-                                              [self.__id]).fetchone()
+        # The geotransform is only 2x3 floats. Plain floats are faster than numpy for that,
+        # so use numpy only for what georef gets and returns, and for the arrays of points.
+        path, previewRect = self.__pathAndPreviewRect()
         assert previewRect is None
         with GdalPushLogHandler():
+            # georef needs the dataset anyway, but not necessarily to get its size.
             ds = gdal.Open(str(__class__.imageRootDir / path))
-            gdalTrafo[:, 1:] *= __class__.__pixMapWidth / ds.RasterXSize  # display -> native resolution.
-            gdalTrafo[1, :] *= -1.  # Scene -> WCS
+            rasterXSize = self.__table.rasterXSize[self.__idx]
+            if rasterXSize is None:
+                self.__table.setRasterSize(self.__idx, ds.RasterXSize, ds.RasterYSize)
+                rasterXSize = ds.RasterXSize
+            scaleNative2display = __class__.__pixMapWidth / rasterXSize
+            # display -> native resolution, and Scene -> WCS (flip the y-coordinate), in one pass.
+            # Qt actually uses the transpose.
+            s = scaleNative2display
+            gdalTrafo = np.array([[topLeft.x(), s * tr.m11(), s * tr.m21()],
+                                  [-topLeft.y(), -s * tr.m12(), -s * tr.m22()]])
             try:
                 gdalTrafo, aerialPts, orthoPts = georef(ds, gdalTrafo)
             except:
                 return logger.exception('Automatic georeferencing failed.')
-        scaleNative2display = __class__.__pixMapWidth / ds.RasterXSize
+        offset = self.offset()
+        off = offX, offY = offset.x(), offset.y()
         aerialPts *= scaleNative2display
-        orthoPts *= scaleNative2display
-        off = np.array([self.offset().x(), self.offset().y()])
         aerialPts += off
+        orthoPts *= scaleNative2display
         orthoPts += off
-        ptRadius = 3
-        ptPen = QPen(Qt.magenta, 1)
-        ptBrush = QBrush(Qt.magenta)
+        # Draw all points and all lines as 1 item each, instead of 2 items per point pair.
         # Must not set QGraphicsItem.ItemIgnoresTransformations on the lines, or their rotations and lengths will be wrong.
-        # To still result in lines with a width of 2px on screen, adapt it.
-        # Since the view cannot be changed while the lines are displayed, this static width will always be displayed as wanted.
-        linePen = QPen(Qt.cyan, 2. / self.deviceTransform(self.scene().views()[0].viewportTransform()).determinant() ** .5)
-        items = []
-        for aerialPt, orthoPt in zip(aerialPts, orthoPts, strict=True):
-            pt = QGraphicsEllipseItem(-ptRadius, -ptRadius, 2 * ptRadius, 2 * ptRadius, self)
-            pt.setFlag(QGraphicsItem.ItemIgnoresTransformations)
-            pt.setPos(*aerialPt)
-            pt.setPen(ptPen)
-            pt.setBrush(ptBrush)
-            line = QGraphicsLineItem(*aerialPt, *orthoPt, self)
-            line.setPen(linePen)
-            items.extend((pt, line))
-        gdalTrafo[1, :] *= -1.  # WCS -> Scene
-        gdalTrafo[:, 1:] *= 1. / scaleNative2display
-        newPos = gdalTrafo[:, 0] + gdalTrafo[:, 1:] @ -off
-        newTr = gdalTrafo[:, 1:].T
-        newTr = QTransform(newTr[0, 0], newTr[0, 1], newTr[1, 0], newTr[1, 1], 0., 0.)
+        # To still result in sizes in px on screen, adapt them.
+        # Since the view cannot be changed while the lines are displayed, these static sizes will always be displayed as wanted.
+        scene = self.scene()
+        view = scene.views()[0]
+        pxSize = 1. / self.deviceTransform(view.viewportTransform()).determinant() ** .5
+        ptRadius = 3 * pxSize
+        ptPath = QPainterPath()
+        linePath = QPainterPath()
+        addEllipse, moveTo, lineTo = ptPath.addEllipse, linePath.moveTo, linePath.lineTo
+        for aerialPt, orthoPt in zip(aerialPts.tolist(), orthoPts.tolist(), strict=True):
+            addEllipse(QPointF(*aerialPt), ptRadius, ptRadius)
+            moveTo(*aerialPt)
+            lineTo(*orthoPt)
+        pts = QGraphicsPathItem(ptPath, self)
+        pts.setPen(QPen(Qt.magenta, pxSize))
+        pts.setBrush(QBrush(Qt.magenta))
+        lines = QGraphicsPathItem(linePath, self)
+        lines.setPen(QPen(Qt.cyan, 2 * pxSize))
+        items = [pts, lines]
+        # WCS -> Scene, and native -> display resolution.
+        (x0, m11, m21), (y0, m12, m22) = gdalTrafo.tolist()
+        y0 = -y0
+        m11, m21, m12, m22 = m11 / s, m21 / s, -m12 / s, -m22 / s
+        newTr = QTransform(m11, m12, m21, m22, 0., 0.)
+        newPos = QPointF(x0 - m11 * offX - m21 * offY, y0 - m12 * offX - m22 * offY)
         # These will call self.itemChange, update point's position and store the new orientation in the DB.
-        self.setPos(*newPos)
+        self.setPos(newPos)
         self.setTransform(newTr)
-        shift = (pos.x(), pos.y()) - newPos
-        shift = np.sum(shift ** 2) ** .5
-        scale = (np.linalg.det(gdalTrafo[:, 1:].T) / np.linalg.det(transform[:2, :2])) ** .5
+        shift = math.hypot(pos.x() - newPos.x(), pos.y() - newPos.y())
+        scale = (newTr.determinant() / tr.determinant()) ** .5
         msgs = [f'{len(aerialPts)} homologous points', f'Shift: {shift:.2f}m', f'Scale: {scale:.2f}']
         logger.info(f'{Path(path).name} georeferenced: ' + '; '.join(msgs))
-        button = QMessageBox.question(self.scene().views()[0], 'Automatic Georeferencing Results', '\n'.join(msgs) + '\nAccept?')
+        button = QMessageBox.question(view, 'Automatic Georeferencing Results', '\n'.join(msgs) + '\nAccept?')
         if button == QMessageBox.No:
             self.setPos(pos)
             self.setTransform(tr)
         for item in items:
             item.setParentItem(None)
-            self.scene().removeItem(item)
+            scene.removeItem(item)
 
     def id(self):
         return self.__id
 
-    def footprint(self):
-        # CS QGraphicsScene -> WCS: invert y-coordinate
-        return [{'x': pt.x(), 'y': -pt.y()} for pt in self.mapToScene(self.boundingRect())[:-1]]
+    def footprint(self) -> list[dict[str, float]]:
+        # Cached until position, transform, or pixmap size change.
+        if self.__footprint is None:
+            # CS QGraphicsScene -> WCS: invert y-coordinate
+            self.__footprint = [{'x': pt.x(), 'y': -pt.y()} for pt in self.mapToScene(self.boundingRect())[:-1]]
+        return self.__footprint
 
     def radiusBild(self) -> float:
         return self.__radiusBild
 
+    def invRadiusBild(self) -> float:
+        return self.__invRadiusBild
+
 
 def _pixMapHeightFor(width: int, size: QSize) -> int:
     return round(size.height() / size.width() * width)
 
-def _getPixMap(path: Path, width: int, rect: QRect, rotationCcw: int, contrast: ContrastEnhancement):
+def _logicalSize(pm: QPixmap) -> QSizeF:
+    # QGraphicsPixmapItem displays pixmaps with their size divided by their device pixel ratio.
+    return QSizeF(pm.size()) / pm.devicePixelRatio()
+
+def _pixMapCacheKey(params: tuple[str, QRect, int, ContrastEnhancement, int] | None) -> str:
+    if params is None:
+        return ''
+    path, rect, rotationCcw, contrast, resolution = params
+    return f'{path}|{rect.x()},{rect.y()},{rect.width()},{rect.height()}|{rotationCcw}|{contrast.value}|{resolution}'
+
+# scenePos and trafo are stored as binary doubles, which is much cheaper than JSON. previewRect likewise as ints:
+# left, top, width, height, viewRotationCcw
+_posStruct: Final = struct.Struct('<2d')
+_transformStruct: Final = struct.Struct('<9d')
+_previewRectStruct: Final = struct.Struct('<5i')
+
+
+def _packPos(pos: QPointF) -> bytes:
+    return _posStruct.pack(pos.x(), pos.y())
+
+def _unpackPos(value: bytes | str) -> QPointF:
+    if isinstance(value, str):
+        return QPointF(*json.loads(value))  # Legacy database.
+    return QPointF(*_posStruct.unpack(value))
+
+def _packTransform(tr: QTransform) -> bytes:
+    return _transformStruct.pack(tr.m11(), tr.m12(), tr.m13(),
+                                 tr.m21(), tr.m22(), tr.m23(),
+                                 tr.m31(), tr.m32(), tr.m33())
+
+def _unpackPreviewRect(value: bytes | str) -> tuple[int, int, int, int, int]:
+    if isinstance(value, str):
+        return tuple(json.loads(value))  # Legacy database.
+    return _previewRectStruct.unpack(value)
+
+def _toJson(value):
+    if isinstance(value, datetime.date):
+        return str(value)
+    if value is pd.NA:  # Missing value in a pyarrow-backed column.
+        return None
+    raise TypeError(f'Unable to encode type {value.__class__}')
+
+def _metaToJson(meta) -> str:
+    # Empty float cells are NaN, which is no valid JSON. Store them as null instead, like pd.NA.
+    return json.dumps({key: None if isinstance(value, float) and math.isnan(value) else value
+                       for key, value in meta._asdict().items()},
+                      default=_toJson, allow_nan=False)
+
+def _unpackTransform(value: bytes | str) -> QTransform:
+    if isinstance(value, str):
+        return QTransform(*json.loads(value))  # Legacy database.
+    return QTransform(*_transformStruct.unpack(value))
+
+def _probeRasterSize(path: Path, obj: AerialObject) -> None:
+    # This is called from a worker thread.
+    try:
+        with GdalPushLogHandler():
+            ds = gdal.Open(str(path))
+            width, height = ds.RasterXSize, ds.RasterYSize
+    except Exception:
+        logger.exception(f'Failed to determine the size of {path}.')
+        return obj.rasterSizeProbeFailed.emit()
+    obj.rasterSizeProbed.emit(width, height)
+
+def _getImage(path: Path, width: int, displayWidth: int, rect: QRect, rotationCcw: int, contrast: ContrastEnhancement) -> QImage:
+    # This is called from a worker thread. Hence, return a QImage: QPixmap may only be used in the GUI thread.
+    # If width is smaller than rect, then GDAL reads from the best fitting overview, if the dataset provides overviews.
     with GdalPushLogHandler():
         ds = gdal.Open(str(path))
         if rect.isNull():
@@ -842,17 +1216,55 @@ def _getPixMap(path: Path, width: int, rect: QRect, rotationCcw: int, contrast:
                        buf_pixel_space=4, buf_line_space=width * 4, buf_band_space=1,
                        resample_alg=gdal.GRIORA_Gauss,
                        inputOutputBuf=ptr)
-    if rotationCcw != 0:
-        #arr = np.ndarray(shape=(img.height(), img.width(), 4), dtype=np.uint8, buffer=ptr)
-        #rotated = np.rot90(arr, k=rotationCcw)
-        #linear = arr.reshape(-1)
-        #linear[:] = rotated.reshape(-1)
-        # Cannot reshape a (rectangular) QImage ...
-        # So use QImage directly:
-        # "Rotates the coordinate system counterclockwise by the given angle. The angle is specified in degrees."
-        img = img.transformed(QTransform().rotate(-90 * rotationCcw))
+    if rotationCcw % 4:
+        # Cannot reshape a (rectangular) QImage in place. Hence, copy the rotated view into a new QImage of transposed size.
+        # For multiples of 90°, this is much cheaper than the general affine transformation of QImage.transformed.
+        rotated = np.rot90(np.ndarray(shape=(height, width, 4), dtype=np.uint8, buffer=ptr), k=rotationCcw)
+        img = QImage(rotated.shape[1], rotated.shape[0], QImage.Format_RGBA8888)
+        ptr = img.bits()
+        ptr.setsize(img.sizeInBytes())
+        np.copyto(np.ndarray(shape=rotated.shape, dtype=np.uint8, buffer=ptr), rotated)
     enhanceContrast(img, contrast)
-    return QPixmap.fromImage(img)
+    # QPixmap.fromImage keeps it.
+    img.setDevicePixelRatio(width / displayWidth)
+    return img
+
+# All aerials of a spreadsheet share the same type of meta data.
+_toolTipRowPrefixesByType: Final[dict[type, tuple[str, ...]]] = {}
+
+
+def _toolTipRowPrefixes(meta) -> tuple[str, ...]:
+    prefixes = _toolTipRowPrefixesByType.get(type(meta))
+    if prefixes is None:
+        prefixes = _toolTipRowPrefixesByType[type(meta)] = tuple(f'<tr><td>{name}</td><td>' for name in meta._fields)
+    return prefixes
+
+# Pens are requested for every state change and repaint, but there are only a few distinct ones.
+_pointPens: Final[dict[tuple[TransformState, bool], QPen]] = {}
+_imagePens: Final[dict[tuple[Availability, TransformState, bool], QPen]] = {}
+
+
+def _pointPen(transformState: TransformState, hasFocus: bool) -> QPen:
+    key = transformState, hasFocus
+    pen = _pointPens.get(key)
+    if pen is None:
+        pen = _pointPens[key] = QPen(QColor(162, 17, 17) if transformState == TransformState.locked else Qt.black,
+                                     3 if hasFocus else 2,
+                                     transformState.penStyle)
+    return pen
+
+def _imagePen(availability: Availability, transformState: TransformState, hasFocus: bool) -> QPen:
+    key = availability, transformState, hasFocus
+    pen = _imagePens.get(key)
+    if pen is None:
+        pen = _imagePens[key] = QPen(availability.color, 2 if hasFocus else 1, transformState.penStyle)
+        pen.setCosmetic(True)
+    return pen
+
+def _setVisible(item: QGraphicsItem, visible: bool) -> None:
+    # QGraphicsItem.setVisible calls itemChange even if visibility is unchanged.
+    if item.isVisible() != visible:
+        item.setVisible(visible)
 
 def _makeOverlay(name: str, parent: QGraphicsItem, flag: QGraphicsItem.GraphicsItemFlag | None = None):
     pm = QPixmap(':/plugins/selorecon/' + name)
@@ -863,6 +1275,16 @@ def _makeOverlay(name: str, parent: QGraphicsItem, flag: QGraphicsItem.GraphicsI
         item.setFlag(flag)
     return item
 
+def _setOverlayVisible(overlays: dict[str, QGraphicsPixmapItem], name: str, parent: QGraphicsItem, visible: bool,
+                       flag: QGraphicsItem.GraphicsItemFlag | None = None) -> None:
+    # Most aerials never show most of their overlays. Hence, create them only when they are shown for the first time.
+    overlay = overlays.get(name)
+    if overlay is None:
+        if not visible:
+            return
+        overlay = overlays[name] = _makeOverlay(name, parent, flag)
+    _setVisible(overlay, visible)
+
 
 """
 Rules for z-stacking, from top to bottom:
@@ -873,21 +1295,19 @@ Rules for z-stacking, from top to bottom:
 Display aerials with small footprints above those with large ones if they belong to the same group above.
 These rules shall make it easy to orient additional, large scale images using already oriented small scale images as background.
 """
+# Indexed by isRaised << 2 | isLockedImage << 1 | isImage. Levels are spaced by 2, which exceeds the range of 1 / radiusBild.
+_zLevels: Final[tuple[int, ...]] = tuple(
+    2 * (3 if isRaised else 2 if isImage and not isLockedImage else 1 if not isImage else 0)
+    for isRaised in (False, True) for isLockedImage in (False, True) for isImage in (False, True))
+
 def updateZValue(item: AerialImage | AerialPoint) -> None:
     isImage = isinstance(item, AerialImage)
     image = item if isImage else item.image()
-    isLockedImage = isImage and image and image.transformState() == TransformState.locked
-    object = image.object if image else None
-    if item.hasFocus() or object and object.isAnimated():
-        level = 3
-    elif isImage and not isLockedImage:
-        level = 2
-    elif not isImage:
-        level = 1
-    else:
-        level = 0
-    scale = 1.  # 0 <= scale <= 1
-    if image:
-        scale = 1 / image.radiusBild()  # do not hassle around with the adjusted scale and image resolution.
-    nextScale = 2
-    item.setZValue(nextScale * level + scale)
+    isLockedImage = isImage and image.transformState() == TransformState.locked
+    isRaised = item.hasFocus() or image is not None and image.object.isAnimated()
+    # 0 <= scale <= 1. Do not hassle around with the adjusted scale and image resolution.
+    scale = image.invRadiusBild() if image else 1.
+    zValue = _zLevels[isRaised << 2 | isLockedImage << 1 | isImage] + scale
+    # setZValue notifies the item and the scene even if the value is unchanged.
+    if zValue != item.zValue():
+        item.setZValue(zValue)
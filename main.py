@@ -19,7 +19,7 @@
 """
 from __future__ import annotations
 
-from qgis.PyQt.QtGui import QIcon
+from qgis.PyQt.QtGui import QIcon, QPixmapCache
 from qgis.PyQt.QtWidgets import QWidget, QAction
 from qgis.gui import QgisInterface
 
@@ -62,6 +62,10 @@ class SelORecon:
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
 
+        # The cache is process-wide, and aerials look up their pixmaps in it.
+        # Qt's default of 10 MB holds only 1 microfilm scan with full resolution. Never lower what QGIS or others have set.
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), 256 * 1024))  # [KB]
+
         self.add_action(
             ':/plugins/selorecon/bomb',
             'SelORecon',
@@ -18,14 +18,16 @@
  ***************************************************************************/
 
 """
-from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot, QElapsedTimer, QMargins, QRectF, Qt, QUrl
+from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot, QElapsedTimer, QMargins, Qt, QUrl
 from qgis.PyQt.QtGui import QDesktopServices, QIcon, QStandardItem
-from qgis.PyQt.QtWidgets import QActionGroup, QDialog, QDialogButtonBox, QComboBox, QMenu, QMessageBox, QTableView, QTextEdit, QToolButton, QVBoxLayout, QWhatsThis
+from qgis.PyQt.QtWidgets import QAction, QActionGroup, QDialog, QDialogButtonBox, QComboBox, QMenu, QMessageBox, QTableView, QTextEdit, QToolButton, QVBoxLayout, QWhatsThis
 from qgis.PyQt.uic import loadUiType
 
+from concurrent.futures import ThreadPoolExecutor
 import configparser
 import logging
 from pathlib import Path
+import re
 import traceback
 
 from osgeo import gdal
@@ -56,6 +58,15 @@ Form, FormBase = loadUiType(Path(__file__).parent / 'main_window_base.ui',
 
 logger = logging.getLogger(__name__)
 
+# Extracts the layer names from a WMTS sub-dataset path like 'WMTS:url,layer=name'.
+_layerRe = re.compile(r'(?:^|,)layer=([^,]+)')
+
+
+def _openSource(url: str) -> gdal.Dataset:
+    # This is called from a worker thread. The handler and GDAL's configuration options are thread-local.
+    with GdalPushLogHandler():
+        return gdal.Open(url)
+
 
 class MainWindow(FormBase):
 
@@ -94,6 +105,9 @@ class MainWindow(FormBase):
         scene.aerialAvailabilityChanged.connect(webView.aerialAvailabilityChanged)
         scene.aerialUsageChanged.connect(webView.aerialUsageChanged)
         self.__filteredImageIds: set[str] = set()
+        # As last emitted by visualizationChanged.
+        self.__lastUsages: dict[Usage, bool] = {}
+        self.__lastVisualizations: dict[Availability, Visualization] = {}
         webView.filterAerials.connect(self.__filterAerials)
         webView.highlightAerials.connect(scene.highlightAerials)
         webView.showAsImage.connect(scene.showAsImage)
@@ -112,14 +126,18 @@ class MainWindow(FormBase):
             vienna = QIcon(':/plugins/selorecon/vienna')
             globe = QIcon(':/plugins/selorecon/globe-green')
             defIdx = 0
-            # QGIS seems to set the CWD to %USERPROFILE%/Documents, and the default WMTS cache path is ./gdalwmscache
-            for isWMTS, icon, prefix, url in [
+            sources = [
                 (True, austria, '', 'https://mapsneu.wien.gv.at/basemapneu/1.0.0/WMTSCapabilities.xml'),
                 (False, austria, 'BEV ', 'https://data.bev.gv.at/geoserver/BEVdataKAT/wms?SERVICE=WMS&VERSION=1.3.0&REQUEST=GetCapabilities&CRS=EPSG:3857'),
                 (True, vienna, 'Stadt Wien ', 'https://maps.wien.gv.at/wmts/1.0.0/WMTSCapabilities.xml'),
-                (False, globe, '', 'WMS:http://ows.terrestris.de/osm/service')]:
+                (False, globe, '', 'WMS:http://ows.terrestris.de/osm/service')]
+            # Fetch the capabilities of all servers concurrently. GDAL releases the GIL during the HTTP requests.
+            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = [executor.submit(_openSource, url) for *_, url in sources]
+            # QGIS seems to set the CWD to %USERPROFILE%/Documents, and the default WMTS cache path is ./gdalwmscache
+            for (isWMTS, icon, prefix, url), future in zip(sources, futures, strict=True):
                 try:
-                    base = gdal.Open(url)
+                    base = future.result()
                 except RuntimeError as ex:
                     logger.exception(f'Failed to open {url}', exc_info=ex)
                     QMessageBox.warning(
@@ -135,7 +153,7 @@ class MainWindow(FormBase):
                         # However, instead of returning a blank image, MapReadThread shall try reading at a higher overview level.
                         # To get the XML we want, we could open the dataset using path, query its XML using dataset.GetMetadataItem('XML', 'WMTS'),
                         # and edit that. Instead, let's just roll our own.
-                        layers = [el.removeprefix('layer=') for el in path.split(',') if el.startswith('layer=')]
+                        layers = _layerRe.findall(path)
                         assert len(layers) == 1
                         path = (
                             '<GDAL_WMTS>'
@@ -173,10 +191,7 @@ class MainWindow(FormBase):
         ui.mapSelect.setCurrentIndex(defIdx)
 
         def fitVisible():
-            rect = QRectF()
-            for item in scene.items():
-                if item.isVisible():
-                    rect |= item.sceneBoundingRect()
+            rect = scene.visibleItemsBoundingRect()
             if rect:
                 rect = mapView.mapFromScene(rect).boundingRect().marginsAdded(QMargins() + 20)
                 rect = mapView.mapToScene(rect).boundingRect()
@@ -200,24 +215,24 @@ class MainWindow(FormBase):
         menu = QMenu(self)
         group = QActionGroup(menu)
         arrowResize090 = QIcon(':/plugins/selorecon/arrow-resize-090')
-        minMax = group.addAction(menu.addAction(arrowResize090, 'Stretch to minimum / maximum',
-                                 self.__onContrastEnhancement))
+        minMax = group.addAction(menu.addAction(arrowResize090, 'Stretch to minimum / maximum'))
         minMax.setData(ContrastEnhancement.minMax)
         minMax.setCheckable(True)
         chart = QIcon(':/plugins/selorecon/chart')
-        histogram = group.addAction(menu.addAction(chart, 'Histogram equalization',
-                                    self.__onContrastEnhancement))
+        histogram = group.addAction(menu.addAction(chart, 'Histogram equalization'))
         histogram.setData(ContrastEnhancement.histogram)
         histogram.setCheckable(True)
         if claheAvailable:
             chartPlus = QIcon(':/plugins/selorecon/chart--plus')
-            clahe = group.addAction(menu.addAction(chartPlus, 'Contrast limited, adaptive histogram equalization',
-                                    self.__onContrastEnhancement))
+            clahe = group.addAction(menu.addAction(chartPlus, 'Contrast limited, adaptive histogram equalization'))
             clahe.setData(ContrastEnhancement.clahe)
             clahe.setCheckable(True)
             clahe.setChecked(True)
         else:
             histogram.setChecked(True)
+        # The checked actions' data, updated when triggered. Avoids walking the menus on every change.
+        self.__contrastEnhancement: ContrastEnhancement = group.checkedAction().data()
+        group.triggered.connect(self.__onContrastEnhancementTriggered)
         ui.aerialsContrastEnhancement.setMenu(menu)
         ui.aerialsContrastEnhancement.toggled.connect(self.__onContrastEnhancement)
         scene.aerialsLoaded.connect(lambda: ui.aerialsContrastEnhancement.setEnabled(True))
@@ -227,23 +242,23 @@ class MainWindow(FormBase):
                                  (ui.aerialsBlue, Availability.findPreview),
                                  (ui.aerialsGreen, Availability.preview),
                                  (ui.aerialsYellow, Availability.image))
+        self.__checkedVisualizations: dict[Availability, Visualization] = {}
         target = QIcon(':/plugins/selorecon/target')
         picture = QIcon(':/plugins/selorecon/picture')
         for button, avail in self.__availabilities:
-            def func(button=button, avail=avail):
-                return self.__onAvailabilityChanged(button, avail)
-
-            button.toggled.connect(lambda *_, _func=func: _func())
+            button.toggled.connect(lambda *_, _button=button, _avail=avail: self.__onAvailabilityChanged(_button, _avail))
             menu = QMenu(self)
             group = QActionGroup(menu)
-            asPoints = group.addAction(menu.addAction(target, 'as points', func))
+            asPoints = group.addAction(menu.addAction(target, 'as points'))
             asPoints.setData(Visualization.asPoint)
             asPoints.setCheckable(True)
             asPoints.setChecked(True)
-            asImage = group.addAction(menu.addAction(picture, 'as images', func))
+            asImage = group.addAction(menu.addAction(picture, 'as images'))
             asImage.setData(Visualization.asImage)
             asImage.setCheckable(True)
-            group.triggered.connect(lambda *_, _button=button: _button.setChecked(True))
+            self.__checkedVisualizations[avail] = Visualization.asPoint
+            group.triggered.connect(
+                lambda action, _button=button, _avail=avail: self.__onVisualizationTriggered(_button, _avail, action))
             button.setMenu(menu)
             scene.aerialsLoaded.connect(lambda *_, _button=button: _button.setEnabled(True))
 
@@ -296,11 +311,16 @@ class MainWindow(FormBase):
         secs = self.__responseElapsedTimer.elapsed() / 1000
         self.ui.responseElapsed.setText(f'{secs // 60:02.0f}:{secs % 60:02.0f} ago')
 
+    @pyqtSlot(QAction)
+    def __onContrastEnhancementTriggered(self, action) -> None:
+        self.__contrastEnhancement = action.data()
+        self.__onContrastEnhancement()
+
     @pyqtSlot()
     def __onContrastEnhancement(self) -> None:
         ui = self.ui
         if ui.aerialsContrastEnhancement.isChecked():
-            enhancement = ui.aerialsContrastEnhancement.menu().actions()[0].actionGroup().checkedAction().data()
+            enhancement = self.__contrastEnhancement
         else:
             enhancement = ContrastEnhancement.none
         ui.mapView.scene().contrastEnhancementChanged.emit(enhancement)
@@ -309,23 +329,43 @@ class MainWindow(FormBase):
     def __onAvailabilityChanged(self, button, availability) -> None:
         visualization = Visualization.none
         if button.isChecked():
-            visualization = button.menu().actions()[0].actionGroup().checkedAction().data()
+            visualization = self.__checkedVisualizations[availability]
         self.__onVisualizationChanged(visualizations={availability: visualization})
 
+    def __onVisualizationTriggered(self, button, availability, action) -> None:
+        self.__checkedVisualizations[availability] = action.data()
+        if button.isChecked():
+            self.__onAvailabilityChanged(button, availability)
+        else:
+            button.setChecked(True)  # Emits toggled.
+
     @pyqtSlot(set)
     def __filterAerials(self, imageIds: set[str]):
         self.__filteredImageIds = imageIds
-        self.__onVisualizationChanged()
+        self.__onVisualizationChanged(complete=True)
 
     @pyqtSlot(dict, dict)
-    def __onVisualizationChanged(self, usages={}, visualizations={}):
+    def __onVisualizationChanged(self, usages={}, visualizations={}, complete=False):
         if not usages:
             usages = {usage: button.isChecked() for button, usage in self.__usages}
         if not visualizations:
             visualizations = {
-                avail: button.menu().actions()[0].actionGroup().checkedAction(
-                ).data() if button.isChecked() else Visualization.none
+                avail: self.__checkedVisualizations[avail] if button.isChecked() else Visualization.none
                 for button, avail in self.__availabilities}
+        usages = self.__lastUsages | usages
+        visualizations = self.__lastVisualizations | visualizations
+        changedUsages = {key: value for key, value in usages.items() if self.__lastUsages.get(key) != value}
+        changedVisualizations = {key: value for key, value in visualizations.items() if self.__lastVisualizations.get(key) != value}
+        self.__lastUsages, self.__lastVisualizations = usages, visualizations
+        # Aerials ignore the signal if their usage or availability is not among the keys.
+        # Hence, if only one kind of state has changed, pass only its changes, so only affected aerials get updated.
+        if not complete:
+            if not changedUsages and not changedVisualizations:
+                return
+            if not changedVisualizations:
+                usages = changedUsages
+            elif not changedUsages:
+                visualizations = changedVisualizations
         self.ui.mapView.scene().visualizationChanged.emit(usages, visualizations, self.__filteredImageIds)
 
     @pyqtSlot()
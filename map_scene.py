@@ -19,9 +19,9 @@
 """
 from __future__ import annotations
 
-from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot, Qt, QPointF, QSettings
+from qgis.PyQt.QtCore import pyqtSignal, pyqtSlot, Qt, QPointF, QRectF, QSettings
 from qgis.PyQt.QtGui import QKeyEvent, QPen, QPolygonF
-from qgis.PyQt.QtWidgets import QFileDialog, QGraphicsPolygonItem, QGraphicsScene, QInputDialog, QMessageBox
+from qgis.PyQt.QtWidgets import QFileDialog, QGraphicsPolygonItem, QGraphicsScene, QGraphicsSceneHelpEvent, QInputDialog, QMessageBox
 
 import numpy as np
 import pandas as pd
@@ -30,17 +30,140 @@ import sqlite3
 
 import collections
 import configparser
+import contextlib
 import datetime
+import functools
 import gc
 import json
 import logging
+import math
+import operator
+import os
 from pathlib import Path
+import sys
+from typing import Iterable
 
-from .aerial_item import ContrastEnhancement, AerialObject, AerialImage, Availability, Usage
+from .aerial_item import ContrastEnhancement, AerialObject, AerialImage, AerialPoint, AerialsTable, Availability, Usage, Visualization
+
+# orjson parses JSON several times faster than json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _jsonLoads(value: str):
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass  # E.g. NaN, as stored by older versions. json accepts it.
+    return json.loads(value)
+
+# python-calamine parses .xls and .xlsx in Rust, many times faster than xlrd and openpyxl. pandas supports it since 2.2.
+try:
+    import python_calamine
+except ImportError:
+    _excelEngine = None
+else:
+    _excelEngine = 'calamine' if tuple(int(el) for el in pd.__version__.split('.')[:2]) >= (2, 2) else None
+
+# pyarrow-backed columns need much less memory than object columns of Python strings. Missing values are then pd.NA, not NaN.
+# See _numericToNumpy.
+try:
+    import pyarrow
+except ImportError:
+    _dtypeBackend = {}
+else:
+    _dtypeBackend = {'dtype_backend': 'pyarrow'} if tuple(int(el) for el in pd.__version__.split('.')[:2]) >= (2, 0) else {}
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
+def _db2wcs(epsgDb: int, epsgWcs: int) -> tuple[osr.CoordinateTransformation, bool]:
+    # Setting up a transformation is expensive. Spreadsheets use only a few CSs, and the same ones again when re-loaded.
+    # Returns the transformation, and whether the DB's coordinates must be swapped before.
+    csDb = osr.SpatialReference()
+    csDb.ImportFromEPSG(epsgDb)
+    assert csDb.IsProjected() or csDb.IsGeographic()
+    csWcs = osr.SpatialReference()
+    csWcs.ImportFromEPSG(epsgWcs)
+    return osr.CoordinateTransformation(csDb, csWcs), bool(csDb.EPSGTreatsAsNorthingEasting() or csDb.EPSGTreatsAsLatLong())
+
+
+def _findEcwFiles(rootDir: Path, subDirs: Iterable[str]) -> set[str]:
+    # List only rootDir itself and the given sub-directories, not the whole tree, which may be large and on a network drive.
+    # Hence, no directory links are followed, and there can be no cycles.
+    # os.scandir yields the file types along with the names, sparing a stat per file.
+    # Returns the paths relative to rootDir, normalized with _normPath.
+    files = set()
+    for relDir in {'', *subDirs}:
+        try:
+            with os.scandir(os.path.join(rootDir, relDir)) as entries:
+                for entry in entries:
+                    try:
+                        if entry.name.lower().endswith('.ecw') and entry.is_file():
+                            files.add(_normPath(os.path.join(relDir, entry.name) if relDir else entry.name))
+                    except OSError:
+                        pass
+        except OSError:
+            continue
+    return files
+
+
+def _normPath(path: str) -> str:
+    # os.path.normcase folds case on Windows only. On macOS, file systems are case insensitive by default, too.
+    path = os.path.normcase(path)
+    return path.lower() if sys.platform == 'darwin' else path
+
+
+# The spreadsheet cache stores data only, and no pickle: the DB may be on a shared drive, and must not be able to run code.
+# Stored are the columns' names, dtypes, and values, with dates and times as ISO strings, and missing values as null.
+def _frameToJson(df: pd.DataFrame) -> str:
+    def toJson(value):
+        if isinstance(value, datetime.date):  # Includes datetime.datetime and pd.Timestamp.
+            return value.isoformat()
+        raise TypeError(f'Unable to encode type {value.__class__}')
+
+    def isMissing(value) -> bool:
+        return value is None or value is pd.NA or value is pd.NaT or isinstance(value, float) and math.isnan(value)
+
+    columns = []
+    for name, dtype in df.dtypes.items():
+        values = [None if isMissing(value) else value for value in df[name].tolist()]
+        first = next((value for value in values if value is not None), None)
+        kind = 'datetime' if isinstance(first, datetime.datetime) else 'date' if isinstance(first, datetime.date) else ''
+        columns.append((name, str(dtype), kind, values))
+    return json.dumps(columns, default=toJson, allow_nan=False)
+
+def _frameFromJson(data: str) -> pd.DataFrame:
+    parse = {'datetime': datetime.datetime.fromisoformat, 'date': datetime.date.fromisoformat}
+    series = []
+    for name, dtype, kind, values in json.loads(data):
+        if kind:
+            values = [None if value is None else parse[kind](value) for value in values]
+        column = pd.Series(values, dtype=object, name=name)
+        if dtype == 'object':
+            column = column.where(column.notna(), np.nan)  # Like read_excel.
+        else:
+            column = column.astype(dtype)
+        series.append(column)
+    return pd.concat(series, axis='columns') if series else pd.DataFrame()
+
+
+def _numericToNumpy(df: pd.DataFrame) -> None:
+    # Arithmetic and comparisons with pd.NA raise, e.g. for an empty Radius_Bild. Hence, keep only strings and booleans pyarrow-backed,
+    # which save the memory, and convert numeric columns back to numpy, with NaN for missing values, as without pyarrow.
+    for name, dtype in df.dtypes.items():
+        if isinstance(dtype, pd.ArrowDtype) and pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            column = df[name]
+            if pd.api.types.is_integer_dtype(dtype) and not column.hasnans:
+                df[name] = column.astype(dtype.numpy_dtype)
+            else:
+                df[name] = column.astype('float64')
+
+
 def _truncateMsg(msg: str, maxLen=500):
     if len(msg) > maxLen:
         return msg[:maxLen] + ' ...'
@@ -77,9 +200,19 @@ class MapScene(QGraphicsScene):
 
     def __init__(self, *args, epsg: int, config: configparser.ConfigParser, **kwargs) -> None:
         super().__init__(*args, **kwargs)
+        self.__epsg = epsg
         self.__wcs = osr.SpatialReference()
         self.__wcs.ImportFromEPSG(epsg)
         self.__db = None
+        self.__aerials: AerialsTable | None = None
+        # The parsed meta data of aerials by id, as passed to the web page. Meta data in the DB never change.
+        self.__aerialMetas: dict[str, dict] = {}
+        # Keep track of visible aerials, instead of checking the visibility of all items when needed.
+        self.__visibleAerials: set[AerialImage | AerialPoint] = set()
+        # Indexed like self.__aerials. Empty for rows in the DB that are not in the spreadsheet,
+        # and several for rows shared by spreadsheet rows with the same id.
+        self.__aerialObjects: list[list[AerialObject]] = []
+        self.visualizationChanged.connect(self.__onVisualizationChanged)
         self.__attackData = None
         self.__aoi = None
         self.__config = config
@@ -91,6 +224,63 @@ class MapScene(QGraphicsScene):
         if event.key() == Qt.Key_Escape:
             self.setFocusItem(None)
 
+    def setAerialVisible(self, item: AerialImage | AerialPoint, visible: bool) -> None:
+        if visible:
+            self.__visibleAerials.add(item)
+        else:
+            self.__visibleAerials.discard(item)
+
+    def visibleItemsBoundingRect(self) -> QRectF:
+        rect = QRectF()
+        for item in self.__visibleAerials:
+            rect |= item.sceneBoundingRect()
+        if self.__aoi is not None and self.__aoi.isVisible():
+            rect |= self.__aoi.sceneBoundingRect()
+        return rect
+
+    @pyqtSlot(dict, dict, set)
+    def __onVisualizationChanged(self, usages: dict[Usage, bool], visualizations: dict[Availability, Visualization], filteredImageIds: set[str]):
+        # Evaluate the new visibilities of all aerials at once, instead of letting each aerial evaluate them.
+        table = self.__aerials
+        if table is None:
+            return
+        # -1: unaffected; aerials whose usage or availability is not among the keys keep their visibility.
+        usageLut = np.full(len(Usage), -1, dtype=np.int8)
+        for usage, isOn in usages.items():
+            usageLut[usage] = isOn
+        visualizationCodes = {Visualization.none: 0, Visualization.asPoint: 1, Visualization.asImage: 2}
+        visualizationLut = np.full(len(Availability), -1, dtype=np.int8)
+        for availability, visualization in visualizations.items():
+            visualizationLut[availability] = visualizationCodes[visualization]
+        usageIsOn = usageLut[table.usage]
+        visualization = visualizationLut[table.availability]
+        isShown = usageIsOn == 1
+        if filteredImageIds:
+            isShown &= np.isin(table.ids, list(filteredImageIds))
+        asImage = (isShown & (visualization == 2)).tolist()
+        asPoint = (isShown & (visualization == 1)).tolist()
+        for idx in np.flatnonzero((usageIsOn >= 0) & (visualization >= 0)).tolist():
+            for obj in self.__aerialObjects[idx]:
+                obj.setVisualization(asImage[idx], asPoint[idx])
+
+    def helpEvent(self, event: QGraphicsSceneHelpEvent) -> None:
+        # QGraphicsScene shows the tooltip of the topmost item with a tooltip under the mouse.
+        # Aerials create their tooltips lazily, so let the topmost aerial create it now, if there is no other item with a tooltip above it.
+        if widget := event.widget():
+            view = widget.parentWidget()
+            for item in self.items(event.scenePos(), Qt.IntersectsItemShape, Qt.DescendingOrder, view.viewportTransform()):
+                item = item.topLevelItem()
+                if isinstance(item, AerialPoint):
+                    item = item.image()
+                    if item is None:
+                        continue
+                if isinstance(item, AerialImage):
+                    item.object.ensureToolTip()
+                    break
+                if item.toolTip():
+                    break
+        super().helpEvent(event)
+
     @pyqtSlot()
     def selectAerialsFile(self):
         fileName = QFileDialog.getOpenFileName(None, "Load aerial meta data",
@@ -125,8 +315,7 @@ class MapScene(QGraphicsScene):
 
     def unload(self):
         AerialImage.unload()
-        if self.__db is not None:
-            self.__db.close()
+        self.__closeDb()
 
     def __loadAoiFile(self, fileName: Path) -> None:
         def error(msg):
@@ -160,12 +349,12 @@ class MapScene(QGraphicsScene):
                          "Choose another file.")
         assert geom.GetGeometryCount() >= 1
         outerRing = geom.GetGeometryRef(0)
-        pts = outerRing.GetPoints()
-        scenePos = QPointF(pts[0][0], -pts[0][1])
-        qPts = []
-        for pt in pts:
-            qPts.append(QPointF(pt[0], -pt[1]) - scenePos)
-        polyg = QGraphicsPolygonItem(QPolygonF(qPts))
+        # WCS -> CS QGraphicsScene: invert y-coordinate, and make the points relative to the first one, in one vectorized pass.
+        pts = np.array(outerRing.GetPoints(), dtype=float)[:, :2]
+        pts[:, 1] *= -1
+        scenePos = QPointF(*pts[0].tolist())
+        pts -= pts[0]
+        polyg = QGraphicsPolygonItem(QPolygonF([QPointF(x, y) for x, y in pts.tolist()]))
         polyg.setPos(scenePos)
         polyg.setZValue((max(Usage) + 1) * (max(Availability) + 1) * 3)
         pen = QPen(Qt.magenta, 3)
@@ -192,17 +381,32 @@ class MapScene(QGraphicsScene):
             if button == QMessageBox.Discard:
                 rmDb = True
 
-        dfs = pd.read_excel(str(fileName), sheet_name=None, true_values=['Ja', 'ja'], false_values=['Nein', 'nein'])
-        sheet_names = 'Geo_Abfrage_SQL', 'Geo_Abfrage'
-        for sheet_name in sheet_names:
-            df = dfs.get(sheet_name)
-            if df is not None:
-                break
+        stat = fileName.stat()
+        cached = None if rmDb or not dbPath.exists() else __class__.__loadCachedAerialData(dbPath, stat)
+        if cached is not None:
+            df, sheet_name, projectName = cached
+            logger.info(f'Spreadsheet unchanged since last load. Using the cached aerial image meta data of {dbPath}')
         else:
-            __class__.__error('Load aerial image meta data', f"{fileName} contains no sheet named {', '.join(sheet_names)}")
-            return
-        if not self.__cleanAerialData(df, sheet_name):
-            return
+            # Parse only the sheets needed, not the whole workbook.
+            # Still read all columns, since the whole rows are stored as meta data, and get exported.
+            sheet_names = 'Geo_Abfrage_SQL', 'Geo_Abfrage'
+            with pd.ExcelFile(str(fileName), engine=_excelEngine) as excelFile:
+                for sheet_name in sheet_names:
+                    if sheet_name in excelFile.sheet_names:
+                        break
+                else:
+                    __class__.__error('Load aerial image meta data', f"{fileName} contains no sheet named {', '.join(sheet_names)}")
+                    return
+                df = excelFile.parse(sheet_name, true_values=['Ja', 'ja'], false_values=['Nein', 'nein'], **_dtypeBackend)
+                if _dtypeBackend:
+                    _numericToNumpy(df)
+                try:
+                    zusammenfassung = excelFile.parse('Zusammenfassung', nrows=2)
+                    projectName = str(zusammenfassung.columns[0])
+                except:
+                    projectName = fileName.stem
+            if not self.__cleanAerialData(df, sheet_name):
+                return
 
         AerialImage.previewRootDir = Path(self.__config['PREVIEWS']['rootDir'])
         if not AerialImage.previewRootDir.is_absolute():
@@ -218,63 +422,123 @@ class MapScene(QGraphicsScene):
             self.removeItem(self.__aoi)
         # clear() removes all items and deletes them, but does not call their itemChange before...
         self.clear()
+        self.__visibleAerials.clear()
+        self.__aerialObjects = []
         # ... so we need to explicitly reset MainWindow.__nVisibleAerials
         self.noAerialsVisible.emit()
         # Beyond this line, old graphics items must not receive signals any longer, as their DB gets closed.
-        # Since AerialPoint, AerialImage, and AerialObject do not create reference cycles,
-        # they should be destroyed immediately by QGraphicsScene.clear.
-        # But let's be sure:
+        # AerialObject and AerialImage reference each other, so AerialObjects are not destroyed by QGraphicsScene.clear,
+        # but only by the garbage collector:
         gc.collect()
         if self.__aoi is not None:
             self.addItem(self.__aoi)
-        if self.__db is not None:
-            self.__db.close()
-            self.__db = None
+        self.__closeDb()
         if rmDb:
             dbPath.unlink()
-        self.__db = sqlite3.connect(dbPath, isolation_level=None)
+        isNewDb = not dbPath.exists()
+        # Queries are re-issued per aerial. Let sqlite3 re-use their compiled statements.
+        self.__db = sqlite3.connect(dbPath, isolation_level=None, cached_statements=256)
         self.__db.execute('PRAGMA busy_timeout = 5000')
         self.__db.execute('PRAGMA foreign_keys = ON')
-        AerialImage.createTables(self.__db)
-
-        xlsImgFiles = []
-        shouldBeMissing = []
-        shouldBeThere = []
-        aerialObjects = []
-        # Speed up the creating of a new DB, especially if it is located on a network drive.
-        # Also, errors during setup will leave an existing DB in its original state.
-        self.__db.execute('BEGIN TRANSACTION')
-        for idx, row in enumerate(df.itertuples(index=False)):
-            imgId = f'{row.Datum.year}-{row.Datum.month:02}-{row.Datum.day:02}_{row.Sortie}_{row.Bildnr}.ecw'
-            if not (AerialImage.imageRootDir / imgId).exists():
-                imgId = (Path(row.Sortie) / f'{row.Bildnr}.ecw').as_posix()
-            imgFilePath = AerialImage.imageRootDir / imgId
-            if not row.LBDB and imgFilePath.exists():
-                shouldBeMissing.append(imgFilePath.name)
-            elif row.LBDB and not imgFilePath.exists():
-                shouldBeThere.append(imgFilePath.name)
-            xlsImgFiles.append(imgFilePath)
-            csDb = osr.SpatialReference()
-            csDb.ImportFromEPSG(row.EPSG_Code)
-            assert csDb.IsProjected() or csDb.IsGeographic()
-            db2wcs = osr.CoordinateTransformation(csDb, self.__wcs)
-            x, y = row.x, row.y
-            if csDb.EPSGTreatsAsNorthingEasting() or csDb.EPSGTreatsAsLatLong():
-                x, y = y, x
-            wcsCtr = db2wcs.TransformPoint(x, y)
-            if idx == 0:
-                # Consider the scale distortion of Web Mercator.
+        # The DB resides next to the spreadsheet, possibly on a network drive. Hence, neither use WAL nor memory mapping,
+        # which both require shared memory among processes. But sync less often, and keep more pages and temporaries in memory.
+        self.__db.execute('PRAGMA synchronous = NORMAL')
+        self.__db.execute('PRAGMA temp_store = MEMORY')
+        self.__db.execute('PRAGMA cache_size = -65536')  # [KiB]
+        if isNewDb:
+            # If creating a new DB fails, then it is useless anyway. So while filling it, do not sync at all,
+            # and keep the rollback journal in memory only. Restored below, also on errors.
+            self.__db.execute('PRAGMA journal_mode = MEMORY')
+            self.__db.execute('PRAGMA synchronous = OFF')
+        try:
+            AerialImage.createTables(self.__db)
+
+            shouldBeMissing = []
+            shouldBeThere = []
+            aerials = []
+            # Speed up the creating of a new DB, especially if it is located on a network drive.
+            # Also, errors during setup will leave an existing DB in its original state.
+            self.__db.execute('BEGIN TRANSACTION')
+            if cached is None:
+                __class__.__cacheAerialData(self.__db, stat, df, sheet_name, projectName)
+            # Transform the positions of all aerials in the same CS at once, setting up each transformation only once.
+            wcsCtrs = np.empty((len(df), 3))
+            xys = df[['x', 'y']].to_numpy(dtype=float)
+            for epsg, indices in df.groupby('EPSG_Code', sort=False, dropna=False).indices.items():
+                db2wcs, swapXY = _db2wcs(int(epsg), self.__epsg)
+                xy = xys[indices]
+                if swapXY:
+                    xy = xy[:, ::-1]
+                wcsCtrs[indices] = db2wcs.TransformPoints(xy.tolist())
+            if len(wcsCtrs):
+                # Consider the scale distortion of Web Mercator, at the first aerial.
                 csWgs84Cartesian = osr.SpatialReference()
                 csWgs84Cartesian.ImportFromEPSG(4978)
                 wcs2cartesian = osr.CoordinateTransformation(self.__wcs, csWgs84Cartesian)
-                pt2 = np.array(wcsCtr)
-                pt2[0] += 1000
-                cartes1 = np.array(wcs2cartesian.TransformPoint(*wcsCtr))
-                cartes2 = np.array(wcs2cartesian.TransformPoint(*pt2))
-                AerialImage.scaleCartesian2map = float(1000. / np.linalg.norm(cartes2 - cartes1))
-            # WCS -> CS QGraphicsScene: invert y-coordinate
-            aerialObjects.append(AerialObject(self, QPointF(wcsCtr[0], -wcsCtr[1]), str(imgId), row, self.__db))
-        self.__db.execute('COMMIT TRANSACTION')
+                pt1 = wcsCtrs[0].tolist()
+                pt2 = [pt1[0] + 1000, *pt1[1:]]
+                cartes = np.array(wcs2cartesian.TransformPoints([pt1, pt2]))
+                AerialImage.scaleCartesian2map = float(1000. / np.linalg.norm(cartes[1] - cartes[0]))
+            # List the image files once, instead of querying the possibly remote file system up to twice per aerial.
+            # The rows are still needed as a whole, as meta data. Get the columns used here once, as lists of Python objects.
+            columns = [df[name].tolist() for name in ('Datum', 'Sortie', 'Bildnr', 'LBDB')]
+            # Ids without the date are relative to the sortie's directory.
+            imgFiles = _findEcwFiles(AerialImage.imageRootDir, (str(sortie) for sortie in set(columns[1])))
+            for row, datum, sortie, bildnr, lbdb, wcsCtr in zip(df.itertuples(index=False), *columns, wcsCtrs.tolist(), strict=True):
+                imgId = f'{datum.year}-{datum.month:02}-{datum.day:02}_{sortie}_{bildnr}.ecw'
+                if _normPath(imgId) not in imgFiles:
+                    imgId = f'{sortie}/{bildnr}.ecw'.replace(os.sep, '/')  # Like Path.as_posix, without constructing a Path.
+                    imgFileExists = _normPath(imgId) in imgFiles
+                else:
+                    imgFileExists = True
+                # Compare and report plain strings. There is no need to construct a Path per aerial.
+                if lbdb is pd.NA:
+                    pass  # Unknown, with pyarrow dtypes.
+                elif not lbdb and imgFileExists:
+                    shouldBeMissing.append(imgId.rpartition('/')[2])
+                elif lbdb and not imgFileExists:
+                    shouldBeThere.append(imgId.rpartition('/')[2])
+                # WCS -> CS QGraphicsScene: invert y-coordinate
+                aerials.append((str(imgId), QPointF(wcsCtr[0], -wcsCtr[1]), imgFileExists, row))
+            # Without a matching file, ids do not contain the date, so several rows of the spreadsheet may share the same id.
+            # Insert each id only once. Like aerials already in the DB, later rows with that id then use the row of the first one.
+            existingIds = {imgId for imgId, in self.__db.execute('SELECT id FROM aerials')}
+            isNews = []
+            newAerials = []
+            for imgId, posScene, imgFileExists, row in aerials:
+                isNew = imgId not in existingIds
+                isNews.append(isNew)
+                if isNew:
+                    existingIds.add(imgId)
+                    newAerials.append((imgId, posScene, imgId if imgFileExists else None, row))
+            AerialImage.insertAerials(self.__db, newAerials)
+            table = self.__aerials = AerialsTable(self.__db)
+            AerialImage.probeFilmDirs(imgId.rpartition('/')[0] for imgId, *_ in aerials if table.path[table.id2idx[imgId]] is None)
+            # Do not update the BSP tree and the views item by item while adding many items, but rebuild and repaint once afterwards.
+            # Signals are not blocked, since e.g. the number of visible aerials is tracked by them.
+            indexMethod = self.itemIndexMethod()
+            self.setItemIndexMethod(QGraphicsScene.NoIndex)
+            views = self.views()
+            for view in views:
+                view.setUpdatesEnabled(False)
+            try:
+                aerialObjects = [AerialObject(self, posScene, table, table.id2idx[imgId], row, isNew=isNew)
+                                 for (imgId, posScene, _, row), isNew in zip(aerials, isNews, strict=True)]
+            finally:
+                self.setItemIndexMethod(indexMethod)
+                for view in views:
+                    view.setUpdatesEnabled(True)
+            self.__aerialObjects = [[] for _ in range(len(table.ids))]
+            for (imgId, *_), obj in zip(aerials, aerialObjects):
+                self.__aerialObjects[table.id2idx[imgId]].append(obj)
+            table.flush()
+            self.__db.execute('COMMIT TRANSACTION')
+        finally:
+            if isNewDb:
+                if self.__db.in_transaction:
+                    self.__db.execute('ROLLBACK TRANSACTION')
+                self.__db.execute('PRAGMA journal_mode = DELETE')
+                self.__db.execute('PRAGMA synchronous = NORMAL')
 
         for view in self.views():
             view.fitInView(self.itemsBoundingRect(), Qt.KeepAspectRatio)
@@ -282,26 +546,21 @@ class MapScene(QGraphicsScene):
         msgs = []
         if shouldBeMissing:
             msgs.append('{} out of {} files should be missing according to {}, but they are present: {}'.format(
-                len(shouldBeMissing), len(xlsImgFiles), sheet_name, ', '.join(shouldBeMissing)))
+                len(shouldBeMissing), len(df), sheet_name, ', '.join(shouldBeMissing)))
         if shouldBeThere:
             msgs.append('{} out of {} files should be present according to {}, but they are missing: {}'.format(
-                len(shouldBeThere), len(xlsImgFiles), sheet_name, ', '.join(shouldBeThere)))
+                len(shouldBeThere), len(df), sheet_name, ', '.join(shouldBeThere)))
         for msg in msgs:
             logger.warning(msg)
             QMessageBox.warning(self.views()[0], 'Inconsistency', _truncateMsg(msg))
 
-        images = [el.image() for el in aerialObjects]
+        images = [el.image for el in aerialObjects]
         availabilityCounts = collections.Counter((image.availability() for image in images))
         title = 'Availabilities of {} aerials'.format(len(aerialObjects))
         msgs = [f'{el.name}:\t{availabilityCounts[el]}' for el in reversed(Availability)]
         logger.info(title + ': ' + ','.join(msgs))
         QMessageBox.information(self.views()[0], title, title + '\n' + '\n'.join(msgs))
 
-        try:
-            zusammenfassung = pd.read_excel(str(fileName), sheet_name='Zusammenfassung', nrows=2)
-            projectName = str(zusammenfassung.columns[0])
-        except:
-            projectName = fileName.stem
         self.projectChanged.emit(projectName)
 
         self.emitAerialsLoaded(images)
@@ -325,7 +584,7 @@ class MapScene(QGraphicsScene):
         # - Attack_List_St_Poelten.xlsx stores them in all upper case,
         # - Projekte LBDB\Image_Selection_Projektbeispiel\Image_Selection_Sample_Vienna\AttackList_Vienna.xlsx in mixed case.
         converters = dict.fromkeys(['DATUM', 'Datum', 'datum'], date2str)
-        df = pd.read_excel(str(fileName), sheet_name='Tabelle1', converters=converters)
+        df = pd.read_excel(str(fileName), sheet_name='Tabelle1', converters=converters, engine=_excelEngine)
         # Homogenize the column names.
         df.rename(mapper=str.capitalize, axis='columns', inplace=True)
         # If we only read the column of attack dates, the rest could be skipped.
@@ -348,7 +607,8 @@ class MapScene(QGraphicsScene):
         self.emitAttackDataLoaded()
 
     def __exportSelectedImages(self, fileName: Path) -> None:
-        assert self.__db is not None
+        assert self.__db is not None and self.__aerials is not None
+        self.__aerials.flush()
         namedTuples = []
         for meta, in self.__db.execute('SELECT meta FROM aerials WHERE usage = ?', [Usage.selected]):
             namedTuples.append(json.loads(meta))
@@ -356,18 +616,28 @@ class MapScene(QGraphicsScene):
         df.to_excel(fileName, sheet_name='Selected aerials', index=False, freeze_panes=(1, 0))
 
     def emitAerialsLoaded(self, images: list[AerialImage] | None = None) -> None:
-        if self.__db is None:
+        if self.__aerials is None:
             return
         if images is None:
             images = [item for item in self.items() if isinstance(item, AerialImage)]
         aerials = {}
+        self.__aerials.flush()
         cursor = self.__db.execute('SELECT * FROM aerials')
-        iId = [el[0] for el in cursor.description].index('id')
-        for row in cursor:
-            aerial = {name: val for (name, *_), val in zip(cursor.description, row)
-                      if name not in ('trafo', 'scenePos', 'previewRect')}
-            aerial['meta'] = json.loads(aerial['meta'])
-            aerials[row[iId]] = aerial
+        names = [el[0] for el in cursor.description]
+        iId = names.index('id')
+        iMeta = names.index('meta')
+        keepIdxs, keepNames = zip(*((idx, name) for idx, name in enumerate(names)
+                                    if name not in ('trafo', 'scenePos', 'previewRect', 'meta')))
+        getKept = operator.itemgetter(*keepIdxs)
+        metas = self.__aerialMetas
+        for row in cursor.fetchall():
+            aerial = dict(zip(keepNames, getKept(row)))
+            imgId = row[iId]
+            meta = metas.get(imgId)
+            if meta is None:
+                meta = metas[imgId] = _jsonLoads(row[iMeta])
+            aerial['meta'] = meta
+            aerials[imgId] = aerial
 
         for image in images:
             imgId, footprint = image.id(), image.footprint()
@@ -389,6 +659,15 @@ class MapScene(QGraphicsScene):
                 [{'x': pt_.x(), 'y': -pt_.y()}
                  for pt in polyg for pt_ in (pt + scenePos,)])
 
+    def __closeDb(self) -> None:
+        if self.__db is not None:
+            if self.__aerials is not None:
+                self.__aerials.flush()
+                self.__aerials = None
+            self.__aerialMetas.clear()
+            self.__db.close()
+            self.__db = None
+
     @property
     def __lastDir(self):
         settings = QSettings("TU WIEN", "Image Selection", self)
@@ -399,6 +678,42 @@ class MapScene(QGraphicsScene):
         settings = QSettings("TU WIEN", "Image Selection", self)
         settings.setValue("lastDir", value)
 
+    @staticmethod
+    def __loadCachedAerialData(dbPath: Path, stat: os.stat_result) -> tuple[pd.DataFrame, str, str] | None:
+        # Parsing the spreadsheet takes long. Re-use its cleaned data, if it has not changed since it was last loaded.
+        try:
+            with contextlib.closing(sqlite3.connect(dbPath)) as db:
+                row = db.execute(
+                    'SELECT sheetName, projectName, data FROM spreadsheetCache WHERE sourceMtimeNs = ? AND sourceSize = ?',
+                    (stat.st_mtime_ns, stat.st_size)).fetchone()
+            if row is None:
+                return None
+            sheetName, projectName, data = row
+            return _frameFromJson(data), sheetName, projectName
+        except Exception as ex:  # E.g. the DB has been created before the cache was introduced, or by an older version.
+            logger.debug(f'No cached aerial image meta data in {dbPath}: {ex}')
+            return None
+
+    @staticmethod
+    def __cacheAerialData(db: sqlite3.Connection, stat: os.stat_result, df: pd.DataFrame, sheetName: str, projectName: str) -> None:
+        db.execute('''
+            CREATE TABLE IF NOT EXISTS spreadsheetCache
+            (
+                sourceMtimeNs INT NOT NULL,
+                sourceSize INT NOT NULL,
+                sheetName TEXT NOT NULL,
+                projectName TEXT NOT NULL,
+                data BLOB NOT NULL  -- The cleaned pd.DataFrame as JSON, see _frameToJson.
+            ) ''')
+        db.execute('DELETE FROM spreadsheetCache')
+        try:
+            data = _frameToJson(df)
+        except Exception as ex:  # The cache is optional. Do not fail loading because of it.
+            logger.debug(f'Unable to cache the aerial image meta data: {ex}')
+            return
+        db.execute('INSERT INTO spreadsheetCache VALUES( ?, ?, ?, ?, ? )',
+                   (stat.st_mtime_ns, stat.st_size, sheetName, projectName, data))
+
     @staticmethod
     def __error(title, msg):
         logger.error(msg)
@@ -413,19 +728,16 @@ class MapScene(QGraphicsScene):
         fulls = {elem.lower() : elem for elem in fulls}
         # Projekte LBDB\Meeting_2021-06-10_Testprojekte\Testprojekt1 and Testprojekt2 contain a column with EPSG-Code, either named 'EPSG-Code', or 'EPSGCode'.
         # More fuzz: Graz contains columns RechtsGK3, HochGK3, RechtsGK4, HochGK4. Both GK4 columns are empty. GK3 columns are filled, but correspond to EPSG:31468 i.e. zone 4, not 3!
-        abbrs = ('epsg', 'EPSG_Code'), ('radius', 'Radius_Bild'), ('rechtsgk3', 'RechtsGK'), ('hochgk3', 'HochGK')
+        abbrs = {'epsg': 'EPSG_Code', 'radius': 'Radius_Bild', 'rechtsgk3': 'RechtsGK', 'hochgk3': 'HochGK'}
+        # Look up both in one pass, lower-casing each column name only once. fulls take precedence.
+        names = abbrs | fulls
         rename = {}
         empty = []
-        for pres in df.columns:
-            if not df[pres].count():
+        for pres, count in df.count().items():
+            if not count:
                 empty.append(pres)
-            elif pres.lower() in fulls:
-                rename[pres] = fulls[pres.lower()]
-            else:
-                for abbr, full in abbrs:
-                    if pres.lower() == abbr.lower():
-                        rename[pres] = full
-                        break
+            elif (full := names.get(pres.lower())) is not None:
+                rename[pres] = full
         df.drop(columns=empty, inplace=True)
         df.rename(columns={old: new for old, new in rename.items() if old != new}, inplace=True)
         df['Datum'] = df['Datum'].dt.date  # strip time of day
@@ -26,14 +26,15 @@ from qgis.PyQt.QtWebKit import QWebSettings
 from qgis.PyQt.QtWebKitWidgets import QWebInspector, QWebPage, QWebView
 
 import functools
+import gzip
 import http
 import http.server
 # must not import logging before PyQt, or logging will fail within pydevd!
 import logging
+import os
 from pathlib import Path
 import threading
 import urllib.parse
-import urllib.request
 
 showWeb = True
 webInspectorSupport = False
@@ -60,7 +61,7 @@ class WebView(QWebView):
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.setWhatsThis('Hit F5 to re-load.' + (' Hit F4 to open Web Inspector.' if webInspectorSupport else ''))
-        self.__httpd: http.server.HTTPServer | None = None
+        self.__httpd: http.server.ThreadingHTTPServer | None = None
         self.__webInspectorDialog = None
 
         # Expose a QObject to JavaScript, to receive signals from there (Qt WebKit Bridge).
@@ -151,10 +152,16 @@ class WebView(QWebView):
         # Pass port=0 to let the OS choose an unused port. This fails sometimes with high port numbers.
         # So pass a specific port that works and is hopefully unused.
         port = 8010
-        self.__httpd = http.server.HTTPServer(('localhost', port), Handler)
+        # The page requests its many scripts and assets concurrently. Serve each request in its own (daemon) thread.
+        self.__httpd = http.server.ThreadingHTTPServer(('localhost', port), Handler)
+
+        # The constructor has already bound the socket and is listening, so requests will be queued until served.
+        # Hence, there is no need to wait for a round trip: only check that the thread has started.
+        started = threading.Event()
 
         def serve_forever():
             assert self.__httpd is not None
+            started.set()
             try:
                 with self.__httpd:
                     self.__httpd.serve_forever()
@@ -166,8 +173,9 @@ class WebView(QWebView):
         thread = threading.Thread(target=serve_forever, daemon=True, name='httpd')
         thread.start()
         url = f'http://localhost:{self.__httpd.server_port}'
-        with urllib.request.urlopen(url + '/index.html') as response:
-            assert response.status == http.HTTPStatus.OK
+        assert (directory / 'index.html').is_file()
+        if not started.wait(timeout=2.):
+            logger.warning(f'{thread.name} has not started yet.')
 
         logger.debug(f'{thread.name} serves {directory} at {url}')
 
@@ -204,6 +212,40 @@ class WebView(QWebView):
 
 class RequestHandler(http.server.SimpleHTTPRequestHandler):
 
+    # Compressed contents of text files, by path, together with the mtime and size of the file they have been compressed from.
+    # Hence, files edited during development are still re-read on F5.
+    __gzipped: dict[str, tuple[int, int, bytes]] = {}
+
+    __gzippedLock = threading.Lock()
+
+    __compressibleTypes = 'text/', 'application/javascript', 'application/json', 'image/svg+xml'
+
+    def do_GET(self):
+        path = self.translate_path(self.path)
+        contentType = self.guess_type(path)
+        if ('gzip' not in self.headers.get('Accept-Encoding', '') or 'If-Modified-Since' in self.headers or
+                not contentType.startswith(__class__.__compressibleTypes) or not os.path.isfile(path)):
+            return super().do_GET()
+        stat = os.stat(path)
+        with __class__.__gzippedLock:
+            mtime, size, body = __class__.__gzipped.get(path, (None, None, None))
+        if (mtime, size) != (stat.st_mtime_ns, stat.st_size):
+            body = gzip.compress(Path(path).read_bytes(), 6)
+            with __class__.__gzippedLock:
+                __class__.__gzipped[path] = stat.st_mtime_ns, stat.st_size, body
+        self.send_response(http.HTTPStatus.OK)
+        self.send_header('Content-type', contentType)
+        self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Last-Modified', self.date_time_string(stat.st_mtime))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def end_headers(self):
+        # Let the browser cache, but re-validate using If-Modified-Since, which SimpleHTTPRequestHandler answers with 304.
+        self.send_header('Cache-Control', 'no-cache')
+        super().end_headers()
+
     def log_message(self, format, *args):
         httpdLogger.debug(format % args)
 